@@ -9,9 +9,14 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Импорты из panelflow.core
 from panelflow.core import Application as CoreApplication
-from panelflow.core.handlers import BasePanelHandler
+from panelflow.core.handlers import BasePanelHandler, on_widget
 
 # Импорт TUI-рендерера
 from panelflow.tui import TuiApplication
@@ -25,23 +30,20 @@ class MainMenuHandler(BasePanelHandler):
     Обработчик для главного меню приложения.
     """
 
-    def on_widget_update(self, widget_id: str, value: Any) -> tuple | None:
-        """
-        Обработка обновлений виджетов в главном меню.
-        """
-        if widget_id == "settings_button":
-            # Переход к панели настроек
-            return ("navigate_down", "settings_panel")
-
-        elif widget_id == "files_button":
-            # Переход к панели файлов
-            return ("navigate_down", "files_panel")
+    @on_widget("settings_button")
+    def open_settings(self, widget_id: str, value: Any) -> tuple | None:
+        """Переход к панели настроек."""
+        return ("navigate_down", "settings_panel")
 
-        elif widget_id == "name_input":
-            # Сохраняем имя пользователя в контексте
-            print(f"Пользователь ввел имя: {value}")
-            return None
+    @on_widget("files_button")
+    def open_files(self, widget_id: str, value: Any) -> tuple | None:
+        """Переход к панели файлов."""
+        return ("navigate_down", "files_panel")
 
+    @on_widget("name_input")
+    def update_name(self, widget_id: str, value: Any) -> tuple | None:
+        """Сохранение имени пользователя."""
+        print(f"Пользователь ввел имя: {value}")
         return None
 
 
@@ -50,19 +52,17 @@ class FilesHandler(BasePanelHandler):
     Обработчик для панели работы с файлами.
     """
 
-    def on_widget_update(self, widget_id: str, value: Any) -> tuple | None:
-        """
-        Обработка действий с файлами.
-        """
-        if widget_id == "file_type_select":
-            print(f"Выбран тип файла: {value}")
-            # Можно создать динамическую панель на основе выбора
-            return None
-
-        elif widget_id == "open_button":
-            print("Открытие файла...")
-            return None
+    @on_widget("file_type_select")
+    def select_file_type(self, widget_id: str, value: Any) -> tuple | None:
+        """Выбор типа файла."""
+        print(f"Выбран тип файла: {value}")
+        # Можно создать динамическую панель на основе выбора
+        return None
 
+    @on_widget("open_button")
+    def open_file(self, widget_id: str, value: Any) -> tuple | None:
+        """Открытие файла."""
+        print("Открытие файла...")
         return None
 
 
@@ -183,8 +183,10 @@ def main():
 
     # Сохраняем во временный файл
     config_path = Path("example_application.json")
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        config_path.write_text(json.dumps(config, ensure_ascii=False, indent=2), encoding='utf-8')
 
     try:
         # Словарь обработчиков
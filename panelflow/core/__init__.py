@@ -2,6 +2,9 @@
 PanelFlow Core Package
 Центральный, платформо-независимый модуль для управления состоянием,
 навигацией и бизнес-логикой приложений PanelFlow.
+
+Рекомендации по производительности (в том числе отказ от Numba) описаны
+в docs/panelflow performance.md.
 """
 
 from .application import Application
@@ -22,7 +25,7 @@ from .events import (
     StateChangedEvent,
     ErrorOccurredEvent
 )
-from .handlers import BasePanelHandler
+from .handlers import BasePanelHandler, on_widget
 from .state import TreeNode
 
 __all__ = [
@@ -35,6 +38,7 @@ __all__ = [
     'AbstractPanel',
     'TreeNode',
     'BasePanelHandler',
+    'on_widget',
     'BaseEvent',
     'WidgetSubmittedEvent',
     'HorizontalNavigationEvent',
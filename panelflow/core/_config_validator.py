@@ -0,0 +1,212 @@
+"""
+Скомпилированная проверка APPLICATION_CONFIG_SCHEMA.
+Сгенерировано utils/generate_config_validator.py - не редактировать вручную.
+"""
+
+SCHEMA_FINGERPRINT = "af9ac8f253dc1bd7cda04951b84ed5ae2f91e846ffb88978d8b79f972288648f"
+
+VERSION = "2.22.2"
+from decimal import Decimal
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+NoneType = type(None)
+
+def validate(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'required': ['entryPanel', 'panels'], 'properties': {'entryPanel': {'type': 'string', 'description': 'ID панели, которая будет показана при запуске приложения'}, 'panels': {'type': 'array', 'description': 'Массив определений панелей', 'items': {'type': 'object', 'required': ['id', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор панели'}, 'title': {'type': 'string', 'description': 'Заголовок панели'}, 'description': {'type': 'string', 'description': 'Описание панели', 'default': ''}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для панели'}, 'widgets': {'type': 'array', 'description': 'Массив виджетов панели', 'items': {'$ref': '#/definitions/widget'}, 'default': []}}}}}, 'definitions': {'panel': {'type': 'object', 'required': ['id', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор панели'}, 'title': {'type': 'string', 'description': 'Заголовок панели'}, 'description': {'type': 'string', 'description': 'Описание панели', 'default': ''}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для панели'}, 'widgets': {'type': 'array', 'description': 'Массив виджетов панели', 'items': {'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'$ref': '#/definitions/widget_text_input'}, {'$ref': '#/definitions/widget_button'}, {'$ref': '#/definitions/widget_option_select'}, {'$ref': '#/definitions/widget_panel_link'}]}, 'default': []}}}, 'widget': {'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'properties': {'type': {'const': 'text_input'}, 'placeholder': {'type': 'string', 'description': 'Текст-подсказка для поля ввода', 'default': ''}}}, {'properties': {'type': {'const': 'button'}}}, {'properties': {'type': {'const': 'option_select'}, 'options': {'type': 'array', 'description': 'Список доступных опций', 'items': {'type': 'string'}, 'default': []}}}, {'required': ['target_panel_id'], 'properties': {'type': {'const': 'panel_link'}, 'target_panel_id': {'type': 'string', 'description': 'ID целевой панели для навигации'}, 'description': {'type': 'string', 'description': 'Описание ссылки', 'default': ''}}}]}, 'widget_text_input': {'properties': {'type': {'const': 'text_input'}, 'placeholder': {'type': 'string', 'description': 'Текст-подсказка для поля ввода', 'default': ''}}}, 'widget_button': {'properties': {'type': {'const': 'button'}}}, 'widget_option_select': {'properties': {'type': {'const': 'option_select'}, 'options': {'type': 'array', 'description': 'Список доступных опций', 'items': {'type': 'string'}, 'default': []}}}, 'widget_panel_link': {'required': ['target_panel_id'], 'properties': {'type': {'const': 'panel_link'}, 'target_panel_id': {'type': 'string', 'description': 'ID целевой панели для навигации'}, 'description': {'type': 'string', 'description': 'Описание ссылки', 'default': ''}}}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['entryPanel', 'panels']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', 'type': 'object', 'required': ['entryPanel', 'panels'], 'properties': {'entryPanel': {'type': 'string', 'description': 'ID панели, которая будет показана при запуске приложения'}, 'panels': {'type': 'array', 'description': 'Массив определений панелей', 'items': {'type': 'object', 'required': ['id', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор панели'}, 'title': {'type': 'string', 'description': 'Заголовок панели'}, 'description': {'type': 'string', 'description': 'Описание панели', 'default': ''}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для панели'}, 'widgets': {'type': 'array', 'description': 'Массив виджетов панели', 'items': {'$ref': '#/definitions/widget'}, 'default': []}}}}}, 'definitions': {'panel': {'type': 'object', 'required': ['id', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор панели'}, 'title': {'type': 'string', 'description': 'Заголовок панели'}, 'description': {'type': 'string', 'description': 'Описание панели', 'default': ''}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для панели'}, 'widgets': {'type': 'array', 'description': 'Массив виджетов панели', 'items': {'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'$ref': '#/definitions/widget_text_input'}, {'$ref': '#/definitions/widget_button'}, {'$ref': '#/definitions/widget_option_select'}, {'$ref': '#/definitions/widget_panel_link'}]}, 'default': []}}}, 'widget': {'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'properties': {'type': {'const': 'text_input'}, 'placeholder': {'type': 'string', 'description': 'Текст-подсказка для поля ввода', 'default': ''}}}, {'properties': {'type': {'const': 'button'}}}, {'properties': {'type': {'const': 'option_select'}, 'options': {'type': 'array', 'description': 'Список доступных опций', 'items': {'type': 'string'}, 'default': []}}}, {'required': ['target_panel_id'], 'properties': {'type': {'const': 'panel_link'}, 'target_panel_id': {'type': 'string', 'description': 'ID целевой панели для навигации'}, 'description': {'type': 'string', 'description': 'Описание ссылки', 'default': ''}}}]}, 'widget_text_input': {'properties': {'type': {'const': 'text_input'}, 'placeholder': {'type': 'string', 'description': 'Текст-подсказка для поля ввода', 'default': ''}}}, 'widget_button': {'properties': {'type': {'const': 'button'}}}, 'widget_option_select': {'properties': {'type': {'const': 'option_select'}, 'options': {'type': 'array', 'description': 'Список доступных опций', 'items': {'type': 'string'}, 'default': []}}}, 'widget_panel_link': {'required': ['target_panel_id'], 'properties': {'type': {'const': 'panel_link'}, 'target_panel_id': {'type': 'string', 'description': 'ID целевой панели для навигации'}, 'description': {'type': 'string', 'description': 'Описание ссылки', 'default': ''}}}}}, rule='required')
+        data_keys = set(data.keys())
+        if "entryPanel" in data_keys:
+            data_keys.remove("entryPanel")
+            data__entryPanel = data["entryPanel"]
+            if not isinstance(data__entryPanel, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".entryPanel must be string", value=data__entryPanel, name="" + (name_prefix or "data") + ".entryPanel", definition={'type': 'string', 'description': 'ID панели, которая будет показана при запуске приложения'}, rule='type')
+        if "panels" in data_keys:
+            data_keys.remove("panels")
+            data__panels = data["panels"]
+            if not isinstance(data__panels, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".panels must be array", value=data__panels, name="" + (name_prefix or "data") + ".panels", definition={'type': 'array', 'description': 'Массив определений панелей', 'items': {'type': 'object', 'required': ['id', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор панели'}, 'title': {'type': 'string', 'description': 'Заголовок панели'}, 'description': {'type': 'string', 'description': 'Описание панели', 'default': ''}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для панели'}, 'widgets': {'type': 'array', 'description': 'Массив виджетов панели', 'items': {'$ref': '#/definitions/widget'}, 'default': []}}}}, rule='type')
+            data__panels_is_list = isinstance(data__panels, (list, tuple))
+            if data__panels_is_list:
+                data__panels_len = len(data__panels)
+                for data__panels_x, data__panels_item in enumerate(data__panels):
+                    validate___definitions_panel(data__panels_item, custom_formats, (name_prefix or "data") + ".panels[{data__panels_x}]".format(**locals()))
+    return data
+
+def validate___definitions_panel(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['id', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор панели'}, 'title': {'type': 'string', 'description': 'Заголовок панели'}, 'description': {'type': 'string', 'description': 'Описание панели', 'default': ''}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для панели'}, 'widgets': {'type': 'array', 'description': 'Массив виджетов панели', 'items': {'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'$ref': '#/definitions/widget_text_input'}, {'$ref': '#/definitions/widget_button'}, {'$ref': '#/definitions/widget_option_select'}, {'$ref': '#/definitions/widget_panel_link'}]}, 'default': []}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['id', 'title']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['id', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор панели'}, 'title': {'type': 'string', 'description': 'Заголовок панели'}, 'description': {'type': 'string', 'description': 'Описание панели', 'default': ''}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для панели'}, 'widgets': {'type': 'array', 'description': 'Массив виджетов панели', 'items': {'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'$ref': '#/definitions/widget_text_input'}, {'$ref': '#/definitions/widget_button'}, {'$ref': '#/definitions/widget_option_select'}, {'$ref': '#/definitions/widget_panel_link'}]}, 'default': []}}}, rule='required')
+        data_keys = set(data.keys())
+        if "id" in data_keys:
+            data_keys.remove("id")
+            data__id = data["id"]
+            if not isinstance(data__id, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".id must be string", value=data__id, name="" + (name_prefix or "data") + ".id", definition={'type': 'string', 'description': 'Уникальный идентификатор панели'}, rule='type')
+        if "title" in data_keys:
+            data_keys.remove("title")
+            data__title = data["title"]
+            if not isinstance(data__title, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".title must be string", value=data__title, name="" + (name_prefix or "data") + ".title", definition={'type': 'string', 'description': 'Заголовок панели'}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Описание панели', 'default': ''}, rule='type')
+        if "handler_class_name" in data_keys:
+            data_keys.remove("handler_class_name")
+            data__handlerclassname = data["handler_class_name"]
+            if not isinstance(data__handlerclassname, (str, NoneType)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".handler_class_name must be string or null", value=data__handlerclassname, name="" + (name_prefix or "data") + ".handler_class_name", definition={'type': ['string', 'null'], 'description': 'Имя класса обработчика для панели'}, rule='type')
+        if "widgets" in data_keys:
+            data_keys.remove("widgets")
+            data__widgets = data["widgets"]
+            if not isinstance(data__widgets, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".widgets must be array", value=data__widgets, name="" + (name_prefix or "data") + ".widgets", definition={'type': 'array', 'description': 'Массив виджетов панели', 'items': {'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'$ref': '#/definitions/widget_text_input'}, {'$ref': '#/definitions/widget_button'}, {'$ref': '#/definitions/widget_option_select'}, {'$ref': '#/definitions/widget_panel_link'}]}, 'default': []}, rule='type')
+            data__widgets_is_list = isinstance(data__widgets, (list, tuple))
+            if data__widgets_is_list:
+                data__widgets_len = len(data__widgets)
+                for data__widgets_x, data__widgets_item in enumerate(data__widgets):
+                    validate___definitions_widget(data__widgets_item, custom_formats, (name_prefix or "data") + ".widgets[{data__widgets_x}]".format(**locals()))
+    return data
+
+def validate___definitions_widget(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'properties': {'type': {'const': 'text_input'}, 'placeholder': {'type': 'string', 'description': 'Текст-подсказка для поля ввода', 'default': ''}}}, {'properties': {'type': {'const': 'button'}}}, {'properties': {'type': {'const': 'option_select'}, 'options': {'type': 'array', 'description': 'Список доступных опций', 'items': {'type': 'string'}, 'default': []}}}, {'required': ['target_panel_id'], 'properties': {'type': {'const': 'panel_link'}, 'target_panel_id': {'type': 'string', 'description': 'ID целевой панели для навигации'}, 'description': {'type': 'string', 'description': 'Описание ссылки', 'default': ''}}}]}, rule='type')
+    data_one_of_count1 = 0
+    if data_one_of_count1 < 2:
+        try:
+            validate___definitions_widget_text_input(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count1 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+    if data_one_of_count1 < 2:
+        try:
+            validate___definitions_widget_button(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count1 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+    if data_one_of_count1 < 2:
+        try:
+            validate___definitions_widget_option_select(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count1 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+    if data_one_of_count1 < 2:
+        try:
+            validate___definitions_widget_panel_link(data, custom_formats, (name_prefix or "data") + "")
+            data_one_of_count1 += 1
+        except (JsonSchemaValueException, JsonSchemaValuesException): pass
+    if data_one_of_count1 != 1:
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be valid exactly by one definition" + (" (" + str(data_one_of_count1) + " matches found)"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'properties': {'type': {'const': 'text_input'}, 'placeholder': {'type': 'string', 'description': 'Текст-подсказка для поля ввода', 'default': ''}}}, {'properties': {'type': {'const': 'button'}}}, {'properties': {'type': {'const': 'option_select'}, 'options': {'type': 'array', 'description': 'Список доступных опций', 'items': {'type': 'string'}, 'default': []}}}, {'required': ['target_panel_id'], 'properties': {'type': {'const': 'panel_link'}, 'target_panel_id': {'type': 'string', 'description': 'ID целевой панели для навигации'}, 'description': {'type': 'string', 'description': 'Описание ссылки', 'default': ''}}}]}, rule='oneOf')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['id', 'type', 'title']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['id', 'type', 'title'], 'properties': {'id': {'type': 'string', 'description': 'Уникальный идентификатор виджета'}, 'type': {'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, 'title': {'type': 'string', 'description': 'Заголовок виджета'}, 'value': {'description': 'Значение виджета по умолчанию'}, 'handler_class_name': {'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}}, 'oneOf': [{'properties': {'type': {'const': 'text_input'}, 'placeholder': {'type': 'string', 'description': 'Текст-подсказка для поля ввода', 'default': ''}}}, {'properties': {'type': {'const': 'button'}}}, {'properties': {'type': {'const': 'option_select'}, 'options': {'type': 'array', 'description': 'Список доступных опций', 'items': {'type': 'string'}, 'default': []}}}, {'required': ['target_panel_id'], 'properties': {'type': {'const': 'panel_link'}, 'target_panel_id': {'type': 'string', 'description': 'ID целевой панели для навигации'}, 'description': {'type': 'string', 'description': 'Описание ссылки', 'default': ''}}}]}, rule='required')
+        data_keys = set(data.keys())
+        if "id" in data_keys:
+            data_keys.remove("id")
+            data__id = data["id"]
+            if not isinstance(data__id, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".id must be string", value=data__id, name="" + (name_prefix or "data") + ".id", definition={'type': 'string', 'description': 'Уникальный идентификатор виджета'}, rule='type')
+        if "type" in data_keys:
+            data_keys.remove("type")
+            data__type = data["type"]
+            if not isinstance(data__type, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be string", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, rule='type')
+            if not (isinstance(data__type, str) and data__type == 'text_input' or isinstance(data__type, str) and data__type == 'button' or isinstance(data__type, str) and data__type == 'option_select' or isinstance(data__type, str) and data__type == 'panel_link'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be one of ['text_input', 'button', 'option_select', 'panel_link']", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'type': 'string', 'enum': ['text_input', 'button', 'option_select', 'panel_link'], 'description': 'Тип виджета'}, rule='enum')
+        if "title" in data_keys:
+            data_keys.remove("title")
+            data__title = data["title"]
+            if not isinstance(data__title, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".title must be string", value=data__title, name="" + (name_prefix or "data") + ".title", definition={'type': 'string', 'description': 'Заголовок виджета'}, rule='type')
+        if "value" in data_keys:
+            data_keys.remove("value")
+            data__value = data["value"]
+        if "handler_class_name" in data_keys:
+            data_keys.remove("handler_class_name")
+            data__handlerclassname = data["handler_class_name"]
+            if not isinstance(data__handlerclassname, (str, NoneType)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".handler_class_name must be string or null", value=data__handlerclassname, name="" + (name_prefix or "data") + ".handler_class_name", definition={'type': ['string', 'null'], 'description': 'Имя класса обработчика для виджета'}, rule='type')
+    return data
+
+def validate___definitions_widget_panel_link(data, custom_formats={}, name_prefix=None):
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['target_panel_id']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'required': ['target_panel_id'], 'properties': {'type': {'const': 'panel_link'}, 'target_panel_id': {'type': 'string', 'description': 'ID целевой панели для навигации'}, 'description': {'type': 'string', 'description': 'Описание ссылки', 'default': ''}}}, rule='required')
+        data_keys = set(data.keys())
+        if "type" in data_keys:
+            data_keys.remove("type")
+            data__type = data["type"]
+            if not (isinstance(data__type, str) and data__type == 'panel_link'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: panel_link", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'panel_link'}, rule='const')
+        if "target_panel_id" in data_keys:
+            data_keys.remove("target_panel_id")
+            data__targetpanelid = data["target_panel_id"]
+            if not isinstance(data__targetpanelid, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".target_panel_id must be string", value=data__targetpanelid, name="" + (name_prefix or "data") + ".target_panel_id", definition={'type': 'string', 'description': 'ID целевой панели для навигации'}, rule='type')
+        if "description" in data_keys:
+            data_keys.remove("description")
+            data__description = data["description"]
+            if not isinstance(data__description, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".description must be string", value=data__description, name="" + (name_prefix or "data") + ".description", definition={'type': 'string', 'description': 'Описание ссылки', 'default': ''}, rule='type')
+    return data
+
+def validate___definitions_widget_option_select(data, custom_formats={}, name_prefix=None):
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "type" in data_keys:
+            data_keys.remove("type")
+            data__type = data["type"]
+            if not (isinstance(data__type, str) and data__type == 'option_select'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: option_select", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'option_select'}, rule='const')
+        if "options" in data_keys:
+            data_keys.remove("options")
+            data__options = data["options"]
+            if not isinstance(data__options, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".options must be array", value=data__options, name="" + (name_prefix or "data") + ".options", definition={'type': 'array', 'description': 'Список доступных опций', 'items': {'type': 'string'}, 'default': []}, rule='type')
+            data__options_is_list = isinstance(data__options, (list, tuple))
+            if data__options_is_list:
+                data__options_len = len(data__options)
+                for data__options_x, data__options_item in enumerate(data__options):
+                    if not isinstance(data__options_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".options[{data__options_x}]".format(**locals()) + " must be string", value=data__options_item, name="" + (name_prefix or "data") + ".options[{data__options_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+    return data
+
+def validate___definitions_widget_button(data, custom_formats={}, name_prefix=None):
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "type" in data_keys:
+            data_keys.remove("type")
+            data__type = data["type"]
+            if not (isinstance(data__type, str) and data__type == 'button'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: button", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'button'}, rule='const')
+    return data
+
+def validate___definitions_widget_text_input(data, custom_formats={}, name_prefix=None):
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data_keys = set(data.keys())
+        if "type" in data_keys:
+            data_keys.remove("type")
+            data__type = data["type"]
+            if not (isinstance(data__type, str) and data__type == 'text_input'):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".type must be same as const definition: text_input", value=data__type, name="" + (name_prefix or "data") + ".type", definition={'const': 'text_input'}, rule='const')
+        if "placeholder" in data_keys:
+            data_keys.remove("placeholder")
+            data__placeholder = data["placeholder"]
+            if not isinstance(data__placeholder, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".placeholder must be string", value=data__placeholder, name="" + (name_prefix or "data") + ".placeholder", definition={'type': 'string', 'description': 'Текст-подсказка для поля ввода', 'default': ''}, rule='type')
+    return data
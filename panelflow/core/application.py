@@ -5,10 +5,33 @@
 """
 
 from pathlib import Path
-from typing import Dict, Type, Any, Callable
+from typing import Dict, Type, Any, Callable, Iterable, Iterator, Mapping
+import contextlib
+import copy
+import functools
+import hashlib
+import inspect
 import json
+import sys
+import weakref
+from types import MappingProxyType
 import jsonschema
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+
+try:
+    # orjson - необязательная зависимость для быстрого разбора конфигурации
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # fastjsonschema - необязательная зависимость: схема компилируется
+    # в специализированную функцию проверки вместо интерпретации ключевых слов
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 from .components import (
     AbstractPanel, AbstractWidget, AbstractTextInput,
@@ -106,63 +129,268 @@ APPLICATION_CONFIG_SCHEMA = {
                     "description": "Имя класса обработчика для виджета"
                 }
             },
-            "allOf": [
-                {
-                    "if": {
-                        "properties": {"type": {"const": "text_input"}}
-                    },
-                    "then": {
-                        "properties": {
-                            "placeholder": {
-                                "type": "string",
-                                "description": "Текст-подсказка для поля ввода",
-                                "default": ""
-                            }
-                        }
-                    }
-                },
-                {
-                    "if": {
-                        "properties": {"type": {"const": "option_select"}}
+            # Тип виджета - дискриминатор: ровно одна из веток подходит по
+            # "const", поэтому валидатор проверяет поля только нужного типа
+            "oneOf": [
+                {"$ref": "#/definitions/widget_text_input"},
+                {"$ref": "#/definitions/widget_button"},
+                {"$ref": "#/definitions/widget_option_select"},
+                {"$ref": "#/definitions/widget_panel_link"}
+            ]
+        },
+        "widget_text_input": {
+            "properties": {
+                "type": {"const": "text_input"},
+                "placeholder": {
+                    "type": "string",
+                    "description": "Текст-подсказка для поля ввода",
+                    "default": ""
+                }
+            }
+        },
+        "widget_button": {
+            "properties": {
+                "type": {"const": "button"}
+            }
+        },
+        "widget_option_select": {
+            "properties": {
+                "type": {"const": "option_select"},
+                "options": {
+                    "type": "array",
+                    "description": "Список доступных опций",
+                    "items": {
+                        "type": "string"
                     },
-                    "then": {
-                        "properties": {
-                            "options": {
-                                "type": "array",
-                                "description": "Список доступных опций",
-                                "items": {
-                                    "type": "string"
-                                },
-                                "default": []
-                            }
-                        }
-                    }
+                    "default": []
+                }
+            }
+        },
+        "widget_panel_link": {
+            "required": ["target_panel_id"],
+            "properties": {
+                "type": {"const": "panel_link"},
+                "target_panel_id": {
+                    "type": "string",
+                    "description": "ID целевой панели для навигации"
                 },
-                {
-                    "if": {
-                        "properties": {"type": {"const": "panel_link"}}
-                    },
-                    "then": {
-                        "required": ["target_panel_id"],
-                        "properties": {
-                            "target_panel_id": {
-                                "type": "string",
-                                "description": "ID целевой панели для навигации"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Описание ссылки",
-                                "default": ""
-                            }
-                        }
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Описание ссылки",
+                    "default": ""
                 }
-            ]
+            }
         }
     }
 }
 
 
+def _intern_optional(value: str | None) -> str | None:
+    """Интернирование необязательной строки из конфигурации."""
+    return sys.intern(value) if value is not None else None
+
+
+def _copy_config_value(value: Any) -> Any:
+    """Копирование значения из конфигурации, если оно изменяемое (список/объект JSON)."""
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
+# Фабрики виджетов по значению поля "type" конфигурации. Аргументы:
+# данные виджета из JSON и общие для всех типов параметры конструктора.
+# Данные конфигурации общие (кэш _load_validated_config, словарь вызывающего
+# в from_validated), поэтому изменяемые значения в шаблон не передаются как есть
+_WIDGET_BUILDERS: Dict[str, Callable[[Mapping[str, Any], Dict[str, Any]], AbstractWidget]] = {
+    "text_input": lambda data, common: AbstractTextInput(
+        placeholder=data.get("placeholder", ""), **common
+    ),
+    "button": lambda data, common: AbstractButton(**common),
+    "option_select": lambda data, common: AbstractOptionSelect(
+        options=_copy_config_value(data.get("options", [])), **common
+    ),
+    "panel_link": lambda data, common: PanelLink(
+        target_panel_id=sys.intern(data["target_panel_id"]),
+        description=data.get("description", ""),
+        **common
+    ),
+}
+
+
+def _make_subscriber_ref(callback: Callable[[BaseEvent], None],
+                         on_collected: Callable[[weakref.WeakMethod], None]
+                         ) -> Callable[[], Callable[[BaseEvent], None] | None]:
+    """
+    Создание ссылки на подписчика событий.
+
+    Связанные методы хранятся через WeakMethod, чтобы подписка не удерживала
+    в памяти объект-владельца (например, пересозданный экран). Обычные функции
+    и лямбды хранятся по сильной ссылке - иначе подписка на анонимную функцию
+    исчезла бы сразу после вызова subscribe_to_events.
+
+    Args:
+        callback: Функция обратного вызова
+        on_collected: Вызывается, когда владелец связанного метода удален
+
+    Returns:
+        Вызываемый объект без аргументов, возвращающий подписчика или None
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback, on_collected)
+    return lambda: callback
+
+
+def _best_config_error(errors: Iterable[ValidationError]) -> ValidationError | None:
+    """
+    Выбор наиболее информативной ошибки проверки конфигурации.
+
+    Для виджетов best_match останавливается на общей ошибке oneOf. Здесь
+    выбирается ветка, совпавшая по дискриминатору "type" (ошибки остальных
+    веток - несовпадения const), а если ни одна не совпала - ошибка
+    самого поля "type".
+
+    Args:
+        errors: Ошибки валидатора jsonschema
+
+    Returns:
+        Ошибка для сообщения пользователю или None, если ошибок нет
+    """
+    errors = list(errors)
+    error = best_match(errors)
+    while error is not None and error.validator == "oneOf":
+        # Ошибки вложенных веток; первый элемент пути схемы - индекс ветки
+        rejected_branches = {e.relative_schema_path[0] for e in error.context if e.validator == "const"}
+        branch_errors = [e for e in error.context if e.relative_schema_path[0] not in rejected_branches]
+        if branch_errors:
+            error = best_match(branch_errors)
+            continue
+
+        type_path = [*error.absolute_path, "type"]
+        type_errors = [e for e in errors if list(e.absolute_path) == type_path]
+        if type_errors:
+            error = best_match(type_errors)
+        break
+    return error
+
+
+def _schema_fingerprint() -> str:
+    """
+    Отпечаток APPLICATION_CONFIG_SCHEMA для проверки актуальности
+    сгенерированного модуля _config_validator.
+
+    Returns:
+        SHA-256 канонического JSON-представления схемы
+    """
+    canonical = json.dumps(APPLICATION_CONFIG_SCHEMA, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _get_compiled_validator() -> Callable[[Mapping[str, Any]], Any]:
+    """
+    Получение скомпилированной fastjsonschema функции проверки.
+
+    Сначала используется заранее сгенерированный модуль _config_validator
+    (см. utils/generate_config_validator.py), если он соответствует текущей
+    схеме; иначе схема компилируется во время выполнения.
+
+    Returns:
+        Функция проверки, выбрасывающая fastjsonschema.JsonSchemaException
+    """
+    try:
+        from . import _config_validator
+    except ImportError:
+        _config_validator = None
+    if (_config_validator is not None
+            and _config_validator.SCHEMA_FINGERPRINT == _schema_fingerprint()):
+        return _config_validator.validate
+
+    logger.debug("Модуль _config_validator отсутствует или устарел, схема компилируется при запуске")
+    # use_default=False: проверка не должна дописывать значения
+    # по умолчанию в данные конфигурации
+    return fastjsonschema.compile(APPLICATION_CONFIG_SCHEMA, use_default=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_config_validator() -> Callable[[Mapping[str, Any]], None]:
+    """
+    Получение функции проверки конфигурации по APPLICATION_CONFIG_SCHEMA.
+
+    Валидатор строится при первом обращении и переиспользуется всеми
+    экземплярами Application (схема статична). Если доступен fastjsonschema,
+    используется скомпилированная функция (см. _get_compiled_validator); иначе
+    jsonschema.Draft7Validator. Сообщение об ошибке в обоих случаях строится
+    по jsonschema, поэтому не зависит от установленных пакетов.
+
+    Returns:
+        Функция, выбрасывающая ValidationError для невалидной конфигурации
+    """
+    validator = jsonschema.Draft7Validator(APPLICATION_CONFIG_SCHEMA)
+
+    def report(config_data: Mapping[str, Any]) -> None:
+        error = _best_config_error(validator.iter_errors(config_data))
+        if error is not None:
+            raise ValidationError(f"Ошибка валидации конфигурации: {error.message}")
+
+    if fastjsonschema is None:
+        return report
+
+    compiled = _get_compiled_validator()
+
+    def validate(config_data: Mapping[str, Any]) -> None:
+        try:
+            compiled(config_data)
+        except fastjsonschema.JsonSchemaException as e:
+            # Повторная проверка только на пути ошибки - ради сообщения
+            report(config_data)
+            raise ValidationError(f"Ошибка валидации конфигурации: {e.message}")
+
+    return validate
+
+
+@functools.lru_cache(maxsize=32)
+def _load_validated_config(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """
+    Чтение и проверка по схеме файла конфигурации с кэшированием.
+
+    mtime_ns и size входят в ключ кэша: изменение файла дает новый ключ,
+    и файл читается заново. Перезапись файла тем же по размеру содержимым
+    в пределах точности временных меток файловой системы ключ не меняет -
+    в этом случае перед повторной загрузкой нужен clear_validator_cache().
+    Ошибки не кэшируются.
+
+    Возвращаемый словарь общий для всех вызовов и не копируется. Его читает
+    только Application._load_config, который не изменяет данные и копирует
+    изменяемые значения в шаблоны виджетов; наружу (validate_config_file)
+    отдается глубокая копия.
+
+    Args:
+        path: Абсолютный путь к файлу конфигурации
+        mtime_ns: Время изменения файла в наносекундах
+        size: Размер файла в байтах
+
+    Returns:
+        Проверенные данные конфигурации
+
+    Raises:
+        json.JSONDecodeError: Если файл содержит невалидный JSON
+        ValidationError: Если JSON не соответствует схеме
+    """
+    # Разбор байтов напрямую, без текстовой обертки над файлом.
+    # orjson.JSONDecodeError наследуется от json.JSONDecodeError
+    config_data = _json_loads(Path(path).read_bytes())
+    _get_config_validator()(config_data)
+    return config_data
+
+
+def clear_validator_cache() -> None:
+    """
+    Сброс закэшированного валидатора и загруженных с ним конфигураций.
+    Нужен тестам, подменяющим схему или доступность fastjsonschema, и для
+    принудительной повторной загрузки файла, перезаписанного без изменения
+    размера и времени модификации (см. _load_validated_config).
+    """
+    _get_config_validator.cache_clear()
+    _load_validated_config.cache_clear()
+
+
 class Application:
     """
     Основной класс приложения PanelFlow.
@@ -174,13 +402,23 @@ class Application:
     - Координацию работы обработчиков
     """
 
-    def __init__(self, config_path: str | Path, handler_map: Dict[str, Type[BasePanelHandler]]):
+    def __init__(
+        self,
+        config_path: str | Path,
+        handler_map: Dict[str, Type[BasePanelHandler]],
+        *,
+        validate_schema: bool = True,
+        validate_integrity: bool = True
+    ):
         """
         Инициализация приложения.
 
         Args:
             config_path: Путь к файлу конфигурации (application.json)
             handler_map: Словарь соответствия имен классов обработчиков их типам
+            validate_schema: Проверять конфигурацию по JSON-схеме. Отключается
+                только для заранее проверенных файлов (см. validate_config_file)
+            validate_integrity: Проверять ссылки между панелями и обработчиками
 
         Raises:
             FileNotFoundError: Если файл конфигурации не найден
@@ -189,74 +427,253 @@ class Application:
         """
         logger.info("Инициализация Application (ядро PanelFlow)")
         logger.debug(f"Путь конфигурации: {config_path}")
+
+        self._init_state(Path(config_path), handler_map)
+
+        # Инициализация
+        self._load_config(validate_schema)
+        if validate_integrity:
+            self._validate_config_integrity()
+        self._create_initial_state()
+
+    @classmethod
+    def from_mapping(
+        cls,
+        config_data: Mapping[str, Any],
+        handler_map: Dict[str, Type[BasePanelHandler]],
+        *,
+        validate_schema: bool = True,
+        validate_integrity: bool = True
+    ) -> "Application":
+        """
+        Создание приложения из уже загруженной конфигурации, без чтения файла.
+
+        По умолчанию конфигурация проходит те же проверки, что и при загрузке
+        из файла.
+
+        Args:
+            config_data: Данные конфигурации в формате application.json
+            handler_map: Словарь соответствия имен классов обработчиков их типам
+            validate_schema: Проверять конфигурацию по JSON-схеме
+            validate_integrity: Проверять ссылки между панелями и обработчиками
+
+        Returns:
+            Инициализированный экземпляр Application (config_path равен None)
+
+        Raises:
+            ValidationError: Если конфигурация не прошла валидацию
+            ValueError: Если найдены ошибки целостности конфигурации
+        """
+        logger.info("Инициализация Application (ядро PanelFlow) из словаря конфигурации")
+
+        app = cls.__new__(cls)
+        app._init_state(None, handler_map)
+
+        if validate_schema:
+            app._validate_json_schema(config_data)
+        app._parse_config_to_objects(config_data)
+        if validate_integrity:
+            app._validate_config_integrity()
+        app._create_initial_state()
+        return app
+
+    @classmethod
+    def from_validated(
+        cls,
+        config_data: Mapping[str, Any],
+        handler_map: Dict[str, Type[BasePanelHandler]]
+    ) -> "Application":
+        """
+        Создание приложения из конфигурации, уже прошедшей проверку по схеме.
+
+        Предназначено для процессов, разделяющих один заранее проверенный
+        словарь конфигурации (см. validate_config_file). Проверка целостности
+        выполняется, так как зависит от handler_map.
+
+        Args:
+            config_data: Проверенные данные конфигурации
+            handler_map: Словарь соответствия имен классов обработчиков их типам
+
+        Returns:
+            Инициализированный экземпляр Application
+
+        Raises:
+            ValueError: Если найдены ошибки целостности конфигурации
+        """
+        return cls.from_mapping(config_data, handler_map, validate_schema=False)
+
+    @staticmethod
+    def validate_config_file(config_path: str | Path) -> Mapping[str, Any]:
+        """
+        Однократная проверка файла конфигурации по схеме (например, в CI).
+
+        Args:
+            config_path: Путь к файлу конфигурации
+
+        Returns:
+            Проверенные данные конфигурации, пригодные для from_validated.
+            Это собственная копия вызывающего: ее изменение не влияет
+            на кэш загруженных конфигураций
+
+        Raises:
+            FileNotFoundError: Если файл конфигурации не найден
+            json.JSONDecodeError: Если файл содержит невалидный JSON
+            ValidationError: Если JSON не соответствует схеме
+        """
+        path = Path(config_path)
+        stat = path.stat()
+        return copy.deepcopy(
+            _load_validated_config(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        )
+
+    def _init_state(
+        self,
+        config_path: Path | None,
+        handler_map: Dict[str, Type[BasePanelHandler]]
+    ) -> None:
+        """
+        Создание внутреннего состояния до загрузки конфигурации.
+
+        Args:
+            config_path: Путь к файлу конфигурации или None
+            handler_map: Словарь соответствия имен классов обработчиков их типам
+        """
         logger.debug(f"Обработчики: {list(handler_map.keys())}")
 
-        self.config_path = Path(config_path)
+        self.config_path = config_path
         self.handler_map = handler_map
         self._panel_templates: Dict[str, AbstractPanel] = {}
+        # Заранее разрешенные обработчики виджетов шаблонов панелей:
+        # id(шаблон) -> {ID виджета -> (имя обработчика, класс обработчика)}
+        self._template_handlers: Dict[int, Dict[str, tuple[str, Type[BasePanelHandler]]]] = {}
         self._tree_root: TreeNode | None = None
         self._active_node: TreeNode | None = None
-        self._event_subscribers: list[Callable[[BaseEvent], None]] = []
+        # Кэш пути от корня до активного узла (см. _get_path_to_active_node)
+        self._active_path: tuple[TreeNode, ...] | None = None
+        # Индекс живых виджетов: ID виджета -> владельцы (узел, виджет шаблона
+        # панели узла) в порядке регистрации. Несколько владельцев бывает, когда
+        # живые узлы показывают панели с одинаковыми ID виджетов (например,
+        # панель, ссылающаяся на саму себя); правило выбора - в _lookup_widget
+        self._widget_index: Dict[str, list[tuple[TreeNode, AbstractWidget]]] = {}
+        # Кортеж ссылок на подписчиков (см. _make_subscriber_ref). Заменяется
+        # целиком при подписке/отписке, поэтому публикация всегда итерирует
+        # неизменяемый снимок подписчиков
+        self._event_subscribers: tuple[Callable[[], Callable[[BaseEvent], None] | None], ...] = ()
+        # Подписчики на конкретный тип события: тип -> кортеж ссылок
+        # (те же правила замены кортежа, что и для _event_subscribers)
+        self._typed_subscribers: Dict[
+            Type[BaseEvent], tuple[Callable[[], Callable[[BaseEvent], None] | None], ...]
+        ] = {}
+        # Глубина вложенности batch_events и признак отложенного StateChangedEvent
+        self._batch_depth: int = 0
+        self._state_changed_pending: bool = False
         self._entry_panel_id: str = ""
+        # Ссылки из конфигурации для проверки целостности (заполняются
+        # в _parse_config_to_objects): (ID панели/виджета, имя обработчика
+        # или ID целевой панели)
+        self._panel_handler_refs: list[tuple[str, str]] = []
+        self._widget_handler_refs: list[tuple[str, str]] = []
+        self._link_target_refs: list[tuple[str, str]] = []
+
+        # Таблица маршрутизации входящих событий: точный тип события -> обработчик.
+        # Хранит уже связанные методы, чтобы post_event не создавал их заново.
+        # Новые типы входящих событий должны быть зарегистрированы здесь;
+        # их подклассы дописываются при первом событии (_resolve_event_handler).
+        self._event_dispatch: Dict[Type[BaseEvent], Callable[[Any], None] | None] = {
+            WidgetSubmittedEvent: self._handle_widget_submission,
+            HorizontalNavigationEvent: self._handle_horizontal_navigation,
+            VerticalNavigationEvent: self._handle_vertical_navigation,
+            BackNavigationEvent: self._handle_back_navigation,
+        }
 
-        # Инициализация
-        self._load_config()
-        self._validate_config_integrity()
-        self._create_initial_state()
-
-    def subscribe_to_events(self, callback: Callable[[BaseEvent], None]) -> None:
+    def subscribe_to_events(self, callback: Callable[[BaseEvent], None],
+                            event_type: Type[BaseEvent] | None = None) -> None:
         """
         Подписка на события от ядра.
+        Подписка через связанный метод не удерживает объект-владельца:
+        после его удаления подписка снимается автоматически.
 
         Args:
             callback: Функция обратного вызова для обработки событий
+            event_type: Тип события; подписчик получает только события этого
+                типа (без подклассов). None - подписка на все события
         """
-        if callback not in self._event_subscribers:
-            self._event_subscribers.append(callback)
+        subscribers = self._get_subscribers(event_type)
+        if any(ref() == callback for ref in subscribers):
+            return
+        ref = _make_subscriber_ref(callback, self._discard_subscriber_ref)
+        self._set_subscribers(event_type, subscribers + (ref,))
 
-    def unsubscribe_from_events(self, callback: Callable[[BaseEvent], None]) -> None:
+    def unsubscribe_from_events(self, callback: Callable[[BaseEvent], None],
+                                event_type: Type[BaseEvent] | None = None) -> None:
         """
         Отписка от событий.
 
         Args:
             callback: Функция обратного вызова для удаления из подписчиков
+            event_type: Тип события, указанный при подписке
         """
-        if callback in self._event_subscribers:
-            self._event_subscribers.remove(callback)
+        self._set_subscribers(event_type, tuple(
+            ref for ref in self._get_subscribers(event_type) if ref() != callback
+        ))
+
+    @contextlib.contextmanager
+    def batch_events(self) -> Iterator[None]:
+        """
+        Объединение уведомлений об изменении состояния.
+
+        Внутри блока StateChangedEvent не публикуется; после выхода из
+        внешнего блока подписчики получают одно событие, если состояние
+        менялось. ErrorOccurredEvent публикуются сразу. Блоки могут быть
+        вложенными.
+
+        Пример:
+            with app.batch_events():
+                app.post_event(WidgetSubmittedEvent(widget_id="name", value="..."))
+                app.post_event(WidgetSubmittedEvent(widget_id="next", value=True))
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._state_changed_pending:
+                self._state_changed_pending = False
+                self._publish_state_changed()
 
     def post_event(self, event: BaseEvent) -> None:
         """
         Единственная публичная точка входа для обработки событий.
-        Маршрутизирует события к соответствующим внутренним обработчикам.
+        Маршрутизирует события к соответствующим внутренним обработчикам
+        по типу события; подклассы событий наследуют обработчик базового типа.
 
         Args:
             event: Событие для обработки
         """
-        logger.debug(f"Получено событие: {type(event).__name__}")
+        event_type = type(event)
+        logger.debug(f"Получено событие: {event_type.__name__}")
+
+        try:
+            handler = self._event_dispatch[event_type]
+        except KeyError:
+            handler = self._resolve_event_handler(event_type)
+        if handler is None:
+            # Неизвестный тип события - игнорируем
+            return
 
-        if isinstance(event, WidgetSubmittedEvent):
+        if event_type is WidgetSubmittedEvent:
             logger.info(f"WidgetSubmittedEvent: виджет='{event.widget_id}', значение={event.value}")
 
         try:
-            if isinstance(event, WidgetSubmittedEvent):
-                self._handle_widget_submission(event)
-            elif isinstance(event, HorizontalNavigationEvent):
-                self._handle_horizontal_navigation(event)
-            elif isinstance(event, VerticalNavigationEvent):
-                self._handle_vertical_navigation(event)
-            elif isinstance(event, BackNavigationEvent):
-                self._handle_back_navigation(event)
-            else:
-                # Неизвестный тип события - игнорируем
-                pass
+            handler(event)
 
         except Exception as e:
             # Перехватываем любые внутренние ошибки и публикуем событие ошибки
-            logger.error(f"Ошибка при обработке события {type(event).__name__}: {e}", exc_info=True)
+            logger.error(f"Ошибка при обработке события {event_type.__name__}: {e}", exc_info=True)
 
             self._publish_event(ErrorOccurredEvent(
                 title="Внутренняя ошибка ядра",
-                message=f"Ошибка при обработке события {type(event).__name__}: {str(e)}"
+                message=f"Ошибка при обработке события {event_type.__name__}: {str(e)}"
             ))
 
     @property
@@ -271,11 +688,14 @@ class Application:
 
     # Приватные методы для инициализации
 
-    def _load_config(self) -> None:
+    def _load_config(self, validate_schema: bool = True) -> None:
         """
         Загрузка и парсинг конфигурации из application.json.
         Создает объекты AbstractPanel на основе JSON-конфигурации.
 
+        Args:
+            validate_schema: Проверять конфигурацию по JSON-схеме
+
         Raises:
             FileNotFoundError: Если файл конфигурации не найден
             ValidationError: Если JSON не соответствует схеме
@@ -287,22 +707,23 @@ class Application:
             logger.error(f"Файл конфигурации не найден: {self.config_path}")
             raise FileNotFoundError(f"Файл конфигурации не найден: {self.config_path}")
 
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Файл конфигурации не найден: {self.config_path}")
-
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                config_data = json.load(file)
+            if validate_schema:
+                # Неизмененный файл (тот же путь, mtime и размер) повторно
+                # не читается и не проверяется по схеме
+                stat = self.config_path.stat()
+                config_data = _load_validated_config(
+                    str(self.config_path.resolve()), stat.st_mtime_ns, stat.st_size
+                )
+            else:
+                config_data = _json_loads(self.config_path.read_bytes())
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"Ошибка парсинга JSON конфигурации: {e.msg}", e.doc, e.pos)
 
-        # Валидация по схеме
-        self._validate_json_schema(config_data)
-
         # Парсинг в объекты
         self._parse_config_to_objects(config_data)
 
-    def _validate_json_schema(self, config_data: dict) -> None:
+    def _validate_json_schema(self, config_data: Mapping[str, Any]) -> None:
         """
         Валидация JSON-конфигурации по схеме.
 
@@ -312,12 +733,9 @@ class Application:
         Raises:
             ValidationError: Если данные не соответствуют схеме
         """
-        try:
-            validate(instance=config_data, schema=APPLICATION_CONFIG_SCHEMA)
-        except ValidationError as e:
-            raise ValidationError(f"Ошибка валидации конфигурации: {e.message}")
+        _get_config_validator()(config_data)
 
-    def _parse_config_to_objects(self, config_data: dict) -> None:
+    def _parse_config_to_objects(self, config_data: Mapping[str, Any]) -> None:
         """
         Преобразование JSON-конфигурации в объекты AbstractPanel.
 
@@ -325,11 +743,16 @@ class Application:
             config_data: Валидированные данные конфигурации
         """
         logger.debug("Парсинг конфигурации в объекты")
-        self._entry_panel_id = config_data["entryPanel"]
+        self._entry_panel_id = sys.intern(config_data["entryPanel"])
         logger.info(f"Панель входа: {self._entry_panel_id}")
 
-        self._entry_panel_id = config_data["entryPanel"]
         self._panel_templates = {}
+        self._template_handlers = {}
+        # Ссылки для проверки целостности собираются здесь же, чтобы
+        # _validate_config_integrity не обходил панели и виджеты повторно
+        self._panel_handler_refs = panel_handler_refs = []
+        self._widget_handler_refs = widget_handler_refs = []
+        self._link_target_refs = link_target_refs = []
 
         for panel_data in config_data["panels"]:
             # Парсинг виджетов
@@ -337,20 +760,28 @@ class Application:
             for widget_data in panel_data.get("widgets", []):
                 widget = self._create_widget_from_data(widget_data)
                 widgets.append(widget)
+                if widget.handler_class_name:
+                    widget_handler_refs.append((widget.id, widget.handler_class_name))
+                if widget.type == "panel_link":
+                    link_target_refs.append((widget.id, widget.target_panel_id))
 
-            # Создание панели
+            # Создание панели. Шаблоны после загрузки только читаются, поэтому
+            # список виджетов замораживается, а идентификаторы интернируются
             panel = AbstractPanel(
-                id=panel_data["id"],
+                id=sys.intern(panel_data["id"]),
                 title=panel_data["title"],
                 description=panel_data.get("description", ""),
-                widgets=widgets,
-                handler_class_name=panel_data.get("handler_class_name")
+                widgets=tuple(widgets),
+                handler_class_name=_intern_optional(panel_data.get("handler_class_name"))
             )
 
             self._panel_templates[panel.id] = panel
+            self._template_handlers[id(panel)] = self._resolve_panel_handlers(panel)
+            if panel.handler_class_name:
+                panel_handler_refs.append((panel.id, panel.handler_class_name))
         logger.info(f"Загружено {len(self._panel_templates)} панелей")
 
-    def _create_widget_from_data(self, widget_data: dict) -> AbstractWidget:
+    def _create_widget_from_data(self, widget_data: Mapping[str, Any]) -> AbstractWidget:
         """
         Создание виджета на основе данных из конфигурации.
 
@@ -365,32 +796,16 @@ class Application:
         """
         widget_type = widget_data["type"]
         common_params = {
-            "id": widget_data["id"],
+            "id": sys.intern(widget_data["id"]),
             "title": widget_data["title"],
-            "value": widget_data.get("value"),
-            "handler_class_name": widget_data.get("handler_class_name")
+            "value": _copy_config_value(widget_data.get("value")),
+            "handler_class_name": _intern_optional(widget_data.get("handler_class_name"))
         }
 
-        if widget_type == "text_input":
-            return AbstractTextInput(
-                placeholder=widget_data.get("placeholder", ""),
-                **common_params
-            )
-        elif widget_type == "button":
-            return AbstractButton(**common_params)
-        elif widget_type == "option_select":
-            return AbstractOptionSelect(
-                options=widget_data.get("options", []),
-                **common_params
-            )
-        elif widget_type == "panel_link":
-            return PanelLink(
-                target_panel_id=widget_data["target_panel_id"],
-                description=widget_data.get("description", ""),
-                **common_params
-            )
-        else:
+        builder = _WIDGET_BUILDERS.get(widget_type)
+        if builder is None:
             raise ValueError(f"Неизвестный тип виджета: {widget_type}")
+        return builder(widget_data, common_params)
 
     def _validate_config_integrity(self) -> None:
         """
@@ -403,29 +818,29 @@ class Application:
             ValueError: Если найдены ошибки целостности
         """
         errors = []
+        panel_templates = self._panel_templates
+        handler_map = self.handler_map
 
         # Проверка существования entryPanel
-        if self._entry_panel_id not in self._panel_templates:
+        if self._entry_panel_id not in panel_templates:
             errors.append(f"Панель входа '{self._entry_panel_id}' не найдена в конфигурации")
 
-        # Проверка всех панелей
-        for panel_id, panel in self._panel_templates.items():
-            # Проверка handler_class_name панели
-            if panel.handler_class_name and panel.handler_class_name not in self.handler_map:
-                errors.append(
-                    f"Обработчик '{panel.handler_class_name}' для панели '{panel_id}' не найден в handler_map")
-
-            # Проверка виджетов
-            for widget in panel.widgets:
-                # Проверка handler_class_name виджета
-                if widget.handler_class_name and widget.handler_class_name not in self.handler_map:
-                    errors.append(
-                        f"Обработчик '{widget.handler_class_name}' для виджета '{widget.id}' не найден в handler_map")
-
-                # Проверка target_panel_id у PanelLink
-                if isinstance(widget, PanelLink):
-                    if widget.target_panel_id not in self._panel_templates:
-                        errors.append(f"Целевая панель '{widget.target_panel_id}' для ссылки '{widget.id}' не найдена")
+        # Проверка собранных при парсинге ссылок на обработчики и панели
+        errors.extend(
+            f"Обработчик '{handler_class_name}' для панели '{panel_id}' не найден в handler_map"
+            for panel_id, handler_class_name in self._panel_handler_refs
+            if handler_class_name not in handler_map
+        )
+        errors.extend(
+            f"Обработчик '{handler_class_name}' для виджета '{widget_id}' не найден в handler_map"
+            for widget_id, handler_class_name in self._widget_handler_refs
+            if handler_class_name not in handler_map
+        )
+        errors.extend(
+            f"Целевая панель '{target_panel_id}' для ссылки '{widget_id}' не найдена"
+            for widget_id, target_panel_id in self._link_target_refs
+            if target_panel_id not in panel_templates
+        )
 
         if errors:
             raise ValueError("Ошибки целостности конфигурации:\n" + "\n".join(f"- {error}" for error in errors))
@@ -438,22 +853,24 @@ class Application:
         Raises:
             ValueError: Если панель входа не найдена
         """
-        if self._entry_panel_id not in self._panel_templates:
+        entry_panel = self._panel_templates.get(self._entry_panel_id)
+        if entry_panel is None:
             raise ValueError(f"Панель входа '{self._entry_panel_id}' не найдена")
 
-        entry_panel = self._panel_templates[self._entry_panel_id]
-
         # Создание корневого узла
         self._tree_root = TreeNode(
             panel_template=entry_panel,
-            context={},
+            # У корня нет родителя; контекст, как и у дочерних узлов, только для чтения
+            context=MappingProxyType({}),
             form_data={},
             parent=None,
             is_active=True
         )
 
+        self._register_node(self._tree_root)
+
         # Установка активного узла
-        self._active_node = self._tree_root
+        self._set_active_node(self._tree_root)
 
     # Приватные методы обработки событий
 
@@ -472,37 +889,34 @@ class Application:
         """
         logger.debug(f"Обработка подтверждения виджета '{event.widget_id}'")
 
-        # Находим узел, содержащий виджет
-        source_node = self._find_node_by_widget_id(event.widget_id)
-        if not source_node:
+        # Находим узел и виджет одним обращением к индексу
+        entry = self._lookup_widget(event.widget_id)
+        if entry is None:
             # Виджет не найден - игнорируем событие
             return
+        source_node, widget = entry
 
         logger.debug(f"Найден узел панели: '{source_node.panel_template.title}'")
 
         # Автоматически обновляем данные формы
         source_node.form_data[event.widget_id] = event.value
 
-        # Определяем обработчик
-        handler_class_name = None
-
-        # Сначала ищем обработчик у самого виджета
-        for widget in source_node.panel_template.widgets:
-            if widget.id == event.widget_id and widget.handler_class_name:
-                handler_class_name = widget.handler_class_name
-                break
-
-        # Если у виджета нет обработчика, используем обработчик панели
-        if not handler_class_name:
-            handler_class_name = source_node.panel_template.handler_class_name
+        # Определяем обработчик: у шаблонов панелей он разрешен при загрузке
+        panel = source_node.panel_template
+        panel_handlers = self._template_handlers.get(id(panel))
+        if panel_handlers is not None:
+            handler = panel_handlers.get(event.widget_id)
+        else:
+            # Панель создана обработчиком динамически
+            handler = self._resolve_widget_handler(panel, widget)
 
         navigation_command = None
 
         # Если обработчик определен, вызываем его
-        if handler_class_name and handler_class_name in self.handler_map:
+        if handler is not None:
+            handler_class_name, handler_class = handler
             try:
                 # Создаем экземпляр обработчика
-                handler_class = self.handler_map[handler_class_name]
                 handler_instance = handler_class(
                     context=source_node.context,
                     form_data=source_node.form_data
@@ -533,7 +947,7 @@ class Application:
 
         # Если навигации не было, публикуем событие изменения состояния
         # так как form_data изменились
-        self._publish_event(StateChangedEvent(tree_root=self._tree_root))
+        self._publish_state_changed()
 
     def _handle_horizontal_navigation(self, event: HorizontalNavigationEvent) -> None:
         """
@@ -552,12 +966,9 @@ class Application:
             # Нет панелей для навигации
             return
 
-        # Находим индекс активного узла в пути
-        try:
-            current_index = path.index(self._active_node)
-        except ValueError:
-            # Активный узел не найден в пути (не должно происходить)
-            return
+        # Путь строится от корня до активного узла, поэтому активный
+        # узел всегда последний - поиск по пути не нужен
+        current_index = len(path) - 1
 
         # Вычисляем новый индекс
         if event.direction == "next":
@@ -572,7 +983,7 @@ class Application:
             self._set_active_node(new_active_node)
 
             # Публикуем событие изменения состояния
-            self._publish_event(StateChangedEvent(tree_root=self._tree_root))
+            self._publish_state_changed()
 
     def _handle_vertical_navigation(self, event: VerticalNavigationEvent) -> None:
         """
@@ -626,7 +1037,7 @@ class Application:
             self._set_active_node(target_node)
 
             # Публикуем событие изменения состояния
-            self._publish_event(StateChangedEvent(tree_root=self._tree_root))
+            self._publish_state_changed()
 
     def _handle_back_navigation(self, event: BackNavigationEvent) -> None:
         """
@@ -650,9 +1061,10 @@ class Application:
             return
 
         # Рекурсивно уничтожаем все дочерние стеки активного узла
-        for child_stack in list(active_node.children_stacks.values()):
-            self._destroy_stack_recursively(child_stack)
-        active_node.children_stacks.clear()
+        if active_node.children_stacks:
+            for child_stack in list(active_node.children_stacks.values()):
+                self._destroy_stack_recursively(child_stack)
+            active_node.children_stacks.clear()
 
         # Находим стек, которому принадлежит активный узел
         stack_key = None
@@ -676,6 +1088,7 @@ class Application:
             return
 
         # Разрываем связь активного узла с родителем
+        self._unregister_node(active_node)
         active_node.parent = None
         active_node.is_active = False
 
@@ -692,7 +1105,7 @@ class Application:
         self._set_active_node(new_active_node)
 
         # Публикуем событие изменения состояния
-        self._publish_event(StateChangedEvent(tree_root=self._tree_root))
+        self._publish_state_changed()
         logger.debug("Навигация назад завершена")
 
     # Приватные методы навигации
@@ -709,13 +1122,8 @@ class Application:
         """
         logger.info(f"Навигация вниз: от '{source_node.panel_template.title}' -> '{target}'")
 
-        # Проверяем, существует ли стек для данного виджета
-        if source_widget_id in source_node.children_stacks:
-            # Уничтожаем старую ветку
-            old_stack = source_node.children_stacks[source_widget_id]
-            self._destroy_stack_recursively(old_stack)
-
-        # Создаем экземпляр панели
+        # Создаем экземпляр панели до изменения дерева: при ошибке старая
+        # ветка, активный узел и кэш пути до него остаются нетронутыми
         try:
             panel_template = self._create_panel_instance(target, source_node.form_data)
         except ValueError as e:
@@ -726,14 +1134,24 @@ class Application:
             ))
             return
 
+        # Проверяем, существует ли стек для данного виджета
+        if source_widget_id in source_node.children_stacks:
+            # Уничтожаем старую ветку (активный узел в ней сменится ниже
+            # через _set_active_node)
+            old_stack = source_node.children_stacks[source_widget_id]
+            self._destroy_stack_recursively(old_stack)
+
         # Создаем новый узел
         new_node = TreeNode(
             panel_template=panel_template,
-            context=source_node.form_data.copy(),  # Контекст = данные формы родителя
+            # Контекст - представление данных формы родителя только для чтения:
+            # без копирования, изменения родительской формы видны дочерней панели
+            context=MappingProxyType(source_node.form_data),
             form_data={},  # Новая пустая форма
             parent=source_node,
             is_active=False  # Пока не активный
         )
+        self._register_node(new_node)
         logger.debug(f"Создан новый узел для панели '{panel_template.title}'")
 
         # Создаем новый стек с этим узлом
@@ -743,79 +1161,73 @@ class Application:
         self._set_active_node(new_node)
 
         # Публикуем событие изменения состояния
-        self._publish_event(StateChangedEvent(tree_root=self._tree_root))
+        self._publish_state_changed()
 
         logger.debug("Навигация вниз завершена успешно")
 
-    def _find_node_by_widget_id(self, widget_id: str) -> TreeNode | None:
-        """
-        Поиск узла, содержащего виджет с указанным ID.
-
-        Args:
-            widget_id: ID искомого виджета
-
-        Returns:
-            Узел, содержащий виджет, или None если не найден
-        """
-        ...
-
     def _destroy_stack_recursively(self, stack: list[TreeNode]) -> None:
         """
-        Рекурсивное уничтожение стека узлов и всех их дочерних стеков.
+        Уничтожение стека узлов и всех их дочерних стеков.
+        Обход выполняется итеративно, поэтому глубина дерева не ограничена
+        глубиной рекурсии интерпретатора.
 
         Args:
             stack: Стек узлов для уничтожения
         """
-        for node in stack:
-            # Рекурсивно уничтожаем все дочерние стеки
-            for child_stack in list(node.children_stacks.values()):
-                self._destroy_stack_recursively(child_stack)
+        pending = list(stack)
+        stack.clear()
+
+        while pending:
+            node = pending.pop()
 
-            # Очищаем дочерние стеки узла
-            node.children_stacks.clear()
+            # Переносим дочерние узлы в очередь на уничтожение
+            # (у листовых узлов дочерних стеков нет)
+            if node.children_stacks:
+                for child_stack in node.children_stacks.values():
+                    pending.extend(child_stack)
+                    child_stack.clear()
 
-            # Разрываем связь с родителем
+                # Очищаем дочерние стеки узла
+                node.children_stacks.clear()
+
+            # Удаляем узел из индекса виджетов и разрываем связь с родителем
+            self._unregister_node(node)
             node.parent = None
 
             # Снимаем флаг активности если он был активным
             if node.is_active:
                 node.is_active = False
 
-        # Очищаем сам стек
-        stack.clear()
-
-    def _get_path_to_active_node(self) -> list[TreeNode]:
-        """
-        Получение пути от корня до активного узла.
-
-        Returns:
-            Список узлов от корня до активного узла
-        """
-        ...
-
     # Приватные вспомогательные методы
 
-    def _get_path_to_active_node(self) -> list[TreeNode]:
+    def _get_path_to_active_node(self) -> tuple[TreeNode, ...]:
         """
         Получение пути от корня до активного узла.
+        Путь строится подъемом по ссылкам parent, без обхода дерева,
+        и кэшируется до смены активного узла (см. _set_active_node):
+        предки живого узла не меняются.
 
         Returns:
-            Список узлов от корня до активного узла
+            Кортеж узлов от корня до активного узла
         """
+        if self._active_path is not None:
+            return self._active_path
+
         if not self._active_node:
-            return []
+            return ()
 
         path = []
         current = self._active_node
 
         # Идем от активного узла вверх по родителям до корня
-        while current:
+        while current is not None:
             path.append(current)
             current = current.parent
 
         # Разворачиваем путь, чтобы он шел от корня к активному узлу
         path.reverse()
-        return path
+        self._active_path = tuple(path)
+        return self._active_path
 
     def _find_node_by_widget_id(self, widget_id: str) -> TreeNode | None:
         """
@@ -827,41 +1239,242 @@ class Application:
         Returns:
             Узел, содержащий виджет, или None если не найден
         """
+        entry = self._lookup_widget(widget_id)
+        return entry[0] if entry is not None else None
 
-        def search_node(node: TreeNode) -> TreeNode | None:
-            # Проверяем виджеты в текущем узле
-            for widget in node.panel_template.widgets:
-                if widget.id == widget_id:
-                    return node
+    def _lookup_widget(self, widget_id: str) -> tuple[TreeNode, AbstractWidget] | None:
+        """
+        Поиск живого виджета и содержащего его узла по ID виджета.
 
-            # Рекурсивно ищем в дочерних стеках
-            for stack in node.children_stacks.values():
-                for child_node in stack:
-                    result = search_node(child_node)
-                    if result:
-                        return result
+        Если виджет с этим ID есть у нескольких живых узлов, выбирается
+        первый из них в прямом порядке обхода дерева: предок раньше потомка,
+        дочерние стеки - в порядке создания, узлы стека - по порядку; внутри
+        панели - первый виджет с этим ID. ID, которого нет ни у одного живого
+        узла, отсекается одним обращением к индексу, без обхода дерева.
 
-            return None
+        Args:
+            widget_id: ID искомого виджета
 
-        if not self._tree_root:
+        Returns:
+            Пара (узел, виджет) или None если виджет не найден
+        """
+        owners = self._widget_index.get(widget_id)
+        if not owners:
             return None
+        if len(owners) == 1:
+            return owners[0]
+        # min устойчив: для виджетов одного узла остается первый по порядку
+        return min(owners, key=lambda entry: self._tree_order_key(entry[0]))
+
+    @staticmethod
+    def _tree_order_key(node: TreeNode) -> tuple[tuple[int, int], ...]:
+        """
+        Ключ сортировки узла в прямом порядке обхода дерева.
+
+        Ключ - последовательность пар (номер дочернего стека у родителя,
+        позиция в стеке) от корня к узлу; ключ предка - префикс ключа
+        потомка, поэтому при сравнении кортежей предок идет раньше.
+
+        Args:
+            node: Живой узел дерева
+
+        Returns:
+            Ключ для сравнения узлов
+        """
+        key = []
+        current = node
+        while current.parent is not None:
+            parent = current.parent
+            key.append(next(
+                (stack_index, position)
+                for stack_index, stack in enumerate(parent.children_stacks.values())
+                for position, child in enumerate(stack)
+                if child is current
+            ))
+            current = parent
+        key.reverse()
+        return tuple(key)
+
+    def _register_node(self, node: TreeNode) -> None:
+        """
+        Регистрация виджетов узла в индексе виджетов.
 
-        return search_node(self._tree_root)
+        Args:
+            node: Новый узел дерева
+        """
+        index = self._widget_index
+        for widget in node.panel_template.widgets:
+            owners = index.get(widget.id)
+            if owners is None:
+                index[widget.id] = [(node, widget)]
+            else:
+                owners.append((node, widget))
+
+    def _unregister_node(self, node: TreeNode) -> None:
+        """
+        Удаление виджетов узла из индекса виджетов.
+
+        Args:
+            node: Уничтожаемый или отсоединяемый узел
+        """
+        index = self._widget_index
+        for widget in node.panel_template.widgets:
+            owners = index.get(widget.id)
+            if owners is None:
+                continue
+            owners[:] = [entry for entry in owners if entry[0] is not node]
+            if not owners:
+                del index[widget.id]
+
+    def _resolve_panel_handlers(self, panel: AbstractPanel) -> Dict[str, tuple[str, Type[BasePanelHandler]]]:
+        """
+        Разрешение обработчиков для всех виджетов панели.
+        Обработчик виджета имеет приоритет над обработчиком панели.
+
+        Args:
+            panel: Панель, для виджетов которой разрешаются обработчики
+
+        Returns:
+            Словарь ID виджета -> (имя обработчика, класс обработчика);
+            виджеты без зарегистрированного обработчика не включаются
+        """
+        handlers = {}
+        for widget in panel.widgets:
+            handler = self._resolve_widget_handler(panel, widget)
+            if handler is not None and widget.id not in handlers:
+                handlers[widget.id] = handler
+        return handlers
+
+    def _resolve_widget_handler(self, panel: AbstractPanel,
+                                widget: AbstractWidget) -> tuple[str, Type[BasePanelHandler]] | None:
+        """
+        Разрешение обработчика виджета.
+        Обработчик виджета имеет приоритет над обработчиком панели.
+
+        Args:
+            panel: Панель, содержащая виджет
+            widget: Виджет панели
+
+        Returns:
+            Пара (имя обработчика, класс обработчика) или None,
+            если обработчик не задан или отсутствует в handler_map
+        """
+        handler_class_name = widget.handler_class_name or panel.handler_class_name
+        if not handler_class_name:
+            return None
+        handler_class = self.handler_map.get(handler_class_name)
+        if handler_class is None:
+            return None
+        return handler_class_name, handler_class
 
     def _publish_event(self, event: BaseEvent) -> None:
         """
-        Публикация события для всех подписчиков.
+        Публикация события для подписчиков на все события и на его тип.
 
         Args:
             event: Событие для публикации
         """
-        for callback in self._event_subscribers:
+        # Снимки кортежей: подписка/отписка из колбэка не влияет на текущую рассылку
+        subscribers = self._event_subscribers
+        typed_subscribers = self._typed_subscribers.get(type(event))
+        if typed_subscribers:
+            subscribers = subscribers + typed_subscribers
+        if not subscribers:
+            return
+        for ref in subscribers:
+            callback = ref()
+            if callback is None:
+                # Владелец подписчика уже удален сборщиком мусора
+                continue
             try:
                 callback(event)
             except Exception as e:
                 # Логируем ошибку в колбэке, но не прерываем обработку
                 print(f"Ошибка в обработчике события: {e}")
 
+    def _publish_state_changed(self) -> None:
+        """
+        Публикация StateChangedEvent после изменения дерева.
+        Без подписчиков (тесты, пакетная обработка) событие не создается,
+        внутри batch_events - откладывается.
+        """
+        if not (self._event_subscribers or StateChangedEvent in self._typed_subscribers):
+            return
+        if self._batch_depth:
+            # Публикация откладывается до выхода из batch_events
+            self._state_changed_pending = True
+            return
+        self._publish_event(StateChangedEvent(tree_root=self._tree_root))
+
+    def _get_subscribers(self, event_type: Type[BaseEvent] | None
+                         ) -> tuple[Callable[[], Callable[[BaseEvent], None] | None], ...]:
+        """
+        Получение кортежа ссылок на подписчиков.
+
+        Args:
+            event_type: Тип события или None для подписчиков на все события
+
+        Returns:
+            Кортеж ссылок на подписчиков
+        """
+        if event_type is None:
+            return self._event_subscribers
+        return self._typed_subscribers.get(event_type, ())
+
+    def _set_subscribers(self, event_type: Type[BaseEvent] | None,
+                         subscribers: tuple[Callable[[], Callable[[BaseEvent], None] | None], ...]
+                         ) -> None:
+        """
+        Замена кортежа ссылок на подписчиков.
+        Пустые кортежи типов удаляются, чтобы проверка наличия подписчиков
+        сводилась к проверке ключа.
+
+        Args:
+            event_type: Тип события или None для подписчиков на все события
+            subscribers: Новый кортеж ссылок
+        """
+        if event_type is None:
+            self._event_subscribers = subscribers
+        elif subscribers:
+            self._typed_subscribers[event_type] = subscribers
+        else:
+            self._typed_subscribers.pop(event_type, None)
+
+    def _resolve_event_handler(self, event_type: Type[BaseEvent]) -> Callable[[Any], None] | None:
+        """
+        Поиск обработчика для типа события, отсутствующего в таблице.
+
+        Обходит MRO типа и берет обработчик ближайшего зарегистрированного
+        предка. Результат (в том числе отсутствие обработчика) запоминается
+        в таблице, поэтому обход выполняется один раз на тип.
+
+        Args:
+            event_type: Тип события
+
+        Returns:
+            Обработчик или None, если тип не поддерживается
+        """
+        handler = None
+        for base in event_type.__mro__[1:]:
+            handler = self._event_dispatch.get(base)
+            if handler is not None:
+                break
+        self._event_dispatch[event_type] = handler
+        return handler
+
+    def _discard_subscriber_ref(self, ref: weakref.WeakMethod) -> None:
+        """
+        Удаление ссылки на подписчика, владелец которого удален.
+
+        Args:
+            ref: Слабая ссылка на связанный метод-подписчик
+        """
+        for event_type in (None, *self._typed_subscribers):
+            self._set_subscribers(event_type, tuple(
+                subscriber for subscriber in self._get_subscribers(event_type)
+                if subscriber is not ref
+            ))
+
     def _set_active_node(self, node: TreeNode) -> None:
         """
         Установка активного узла с корректным снятием флага с предыдущего.
@@ -873,8 +1486,9 @@ class Application:
         if self._active_node:
             self._active_node.is_active = False
 
-        # Устанавливаем новый активный узел
+        # Устанавливаем новый активный узел; путь до него будет построен заново
         self._active_node = node
+        self._active_path = None
         if node:
             node.is_active = True
 
@@ -893,9 +1507,10 @@ class Application:
             ValueError: Если панель с указанным ID не найдена
         """
         if isinstance(target, str):
-            if target not in self._panel_templates:
+            panel = self._panel_templates.get(target)
+            if panel is None:
                 raise ValueError(f"Панель с ID '{target}' не найдена")
-            return self._panel_templates[target]
+            return panel
         elif isinstance(target, AbstractPanel):
             return target
         else:
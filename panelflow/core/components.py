@@ -5,10 +5,10 @@
 
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class AbstractWidget(ABC):
     """Базовый класс для всех виджетов."""
     id: str
@@ -18,27 +18,27 @@ class AbstractWidget(ABC):
     handler_class_name: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AbstractTextInput(AbstractWidget):
     """Виджет текстового ввода."""
     placeholder: str = ""
     type: str = field(default="text_input", init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class AbstractButton(AbstractWidget):
     """Виджет кнопки."""
     type: str = field(default="button", init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class AbstractOptionSelect(AbstractWidget):
     """Виджет выбора из списка опций."""
     options: list = field(default_factory=list)
     type: str = field(default="option_select", init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class PanelLink(AbstractWidget):
     """Виджет ссылки на другую панель."""
     target_panel_id: str = ""
@@ -46,11 +46,12 @@ class PanelLink(AbstractWidget):
     type: str = field(default="panel_link", init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class AbstractPanel:
     """Класс для описания панели (шаблона экрана)."""
     id: str
     title: str
     description: str = ""
-    widgets: list[AbstractWidget] = field(default_factory=list)
+    # Шаблоны из конфигурации хранят виджеты в неизменяемом кортеже
+    widgets: Sequence[AbstractWidget] = field(default_factory=list)
     handler_class_name: str | None = None
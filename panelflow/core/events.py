@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEvent(ABC):
     """Базовый класс для всех событий в системе."""
     pass
@@ -16,7 +16,7 @@ class BaseEvent(ABC):
 
 # Входящие события (Renderer → Core)
 
-@dataclass
+@dataclass(slots=True)
 class WidgetSubmittedEvent(BaseEvent):
     """
     Событие подтверждения ввода или выбора значения в виджете.
@@ -26,7 +26,7 @@ class WidgetSubmittedEvent(BaseEvent):
     value: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalNavigationEvent(BaseEvent):
     """
     Событие навигации между колонками.
@@ -35,7 +35,7 @@ class HorizontalNavigationEvent(BaseEvent):
     direction: Literal["next", "previous"]
 
 
-@dataclass
+@dataclass(slots=True)
 class VerticalNavigationEvent(BaseEvent):
     """
     Событие навигации по стеку панелей внутри колонки.
@@ -44,7 +44,7 @@ class VerticalNavigationEvent(BaseEvent):
     direction: Literal["up", "down"]
 
 
-@dataclass
+@dataclass(slots=True)
 class BackNavigationEvent(BaseEvent):
     """
     Событие возврата назад (закрытие текущей панели).
@@ -55,7 +55,7 @@ class BackNavigationEvent(BaseEvent):
 
 # Исходящие события (Core → Renderer)
 
-@dataclass
+@dataclass(slots=True)
 class StateChangedEvent(BaseEvent):
     """
     Событие изменения состояния дерева.
@@ -64,7 +64,7 @@ class StateChangedEvent(BaseEvent):
     tree_root: 'TreeNode'
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorOccurredEvent(BaseEvent):
     """
     Событие возникновения внутренней ошибки.
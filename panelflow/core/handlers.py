@@ -3,31 +3,66 @@
 Предоставляет интерфейс для реализации пользовательской логики.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any
+from abc import ABC
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+
+def on_widget(*widget_ids: str) -> Callable[[Callable], Callable]:
+    """
+    Декоратор метода обработчика, вызываемого при обновлении виджетов.
+
+    Метод принимает ID виджета и его значение (как и
+    BasePanelHandler.on_widget_update, поэтому один метод может обслуживать
+    несколько виджетов) и возвращает команду навигации в том же формате.
+
+    Args:
+        widget_ids: ID виджетов, обновления которых обрабатывает метод
+
+    Returns:
+        Декоратор, помечающий метод
+    """
+    def decorator(method: Callable) -> Callable:
+        method._panelflow_widget_ids = widget_ids
+        return method
+    return decorator
 
 
 class BasePanelHandler(ABC):
     """
     Базовый класс для обработчиков панелей.
-    Пользователи должны наследовать этот класс и реализовать on_widget_update.
+    Пользователи должны наследовать этот класс и либо реализовать
+    on_widget_update, либо пометить методы декоратором @on_widget.
     """
 
-    def __init__(self, context: dict, form_data: dict):
+    # Таблица имен методов по ID виджета, строится один раз при создании класса.
+    # Хранятся имена, а не функции: метод разрешается через getattr при вызове,
+    # поэтому переопределение в подклассе без повторного @on_widget учитывается
+    _widget_dispatch: Mapping[str, str] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        dispatch = dict(cls._widget_dispatch)
+        for name, attr in vars(cls).items():
+            for widget_id in getattr(attr, "_panelflow_widget_ids", ()):
+                dispatch[widget_id] = name
+        cls._widget_dispatch = MappingProxyType(dispatch)
+
+    def __init__(self, context: Mapping[str, Any], form_data: dict):
         """
         Инициализация обработчика.
 
         Args:
-            context: Контекст, переданный от родительской панели
+            context: Контекст, переданный от родительской панели (только для чтения)
             form_data: Текущие данные формы панели
         """
         self.context = context
         self.form_data = form_data
 
-    @abstractmethod
     def on_widget_update(self, widget_id: str, value: Any) -> tuple | None:
         """
         Обработка обновления виджета.
+        По умолчанию вызывает метод, помеченный @on_widget для этого виджета.
 
         Args:
             widget_id: ID виджета, который был обновлен
@@ -39,4 +74,7 @@ class BasePanelHandler(ABC):
             - ("navigate_down", AbstractPanel(...)) для навигации по объекту панели
             - None, если навигация не требуется
         """
-        pass
+        method_name = self._widget_dispatch.get(widget_id)
+        if method_name is None:
+            return None
+        return getattr(self, method_name)(widget_id, value)
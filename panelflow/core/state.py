@@ -5,18 +5,26 @@ TreeNode представляет экземпляр панели в дерев
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from uuid import UUID, uuid4
-from typing import TYPE_CHECKING
+from itertools import count
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 if TYPE_CHECKING:
     from .components import AbstractPanel
 
+# Счетчик ID узлов: уникален в пределах процесса и не требует обращения
+# к системному источнику случайности, в отличие от uuid4()
+_node_ids = count(1)
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class TreeNode:
     """
     Узел дерева состояний, представляющий экземпляр панели.
 
+    Узлы сравниваются по идентичности: два узла с одинаковым содержимым
+    остаются разными экземплярами панели.
+
     Каждый узел содержит:
     - Ссылку на шаблон панели
     - Контекст от родителя
@@ -27,8 +35,8 @@ class TreeNode:
     # Ссылка на "шаблон" панели
     panel_template: AbstractPanel
 
-    # Контекст, полученный от родителя
-    context: dict = field(default_factory=dict)
+    # Контекст, полученный от родителя (представление его form_data только для чтения)
+    context: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
 
     # Данные формы, собранные виджетами этого узла
     form_data: dict = field(default_factory=dict)
@@ -41,8 +49,8 @@ class TreeNode:
     # а значение - стек дочерних узлов.
     children_stacks: dict[str, list[TreeNode]] = field(default_factory=dict)
 
-    # Уникальный ID экземпляра
-    node_id: UUID = field(default_factory=uuid4)
+    # Уникальный в пределах процесса ID экземпляра
+    node_id: int = field(default_factory=_node_ids.__next__)
 
     # Флаг фокуса
     is_active: bool = False
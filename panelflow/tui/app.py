@@ -4,6 +4,8 @@
 """
 
 import logging
+import threading
+from typing import Callable, Dict, Tuple, Type
 from textual.app import App
 from textual.widgets import Header, Footer
 
@@ -44,6 +46,13 @@ class TuiApplication(App):
         self.core = core_app
         self.main_screen = None
         self.error_screen = None
+        # Поток цикла событий Textual; фиксируется при монтировании
+        self._ui_thread_id: int | None = None
+        # Тип события ядра -> (обработчик в потоке UI, обработчик для call_from_thread)
+        self._core_event_handlers: Dict[Type[BaseEvent], Tuple[Callable, Callable]] = {
+            StateChangedEvent: (self._handle_state_change, self._handle_state_change_safe),
+            ErrorOccurredEvent: (self._handle_error, self._handle_error),
+        }
 
         logger.info("Инициализация TuiApplication")
         logger.debug(f"Ядро приложения: {type(core_app).__name__}")
@@ -59,6 +68,7 @@ class TuiApplication(App):
 
     async def on_mount(self) -> None:
         """При монтировании приложения создаем главный экран."""
+        self._ui_thread_id = threading.get_ident()
         self.main_screen = MainScreen(self.core)
         self.error_screen = ErrorScreen()
 
@@ -77,34 +87,28 @@ class TuiApplication(App):
         logger.info(f"========== ПОЛУЧЕНО СОБЫТИЕ ОТ ЯДРА ==========")
         logger.info(f"Тип события: {type(event).__name__}")
 
-        if isinstance(event, StateChangedEvent):
-            logger.info("Это StateChangedEvent - планируем обработку")
-            logger.debug(f"tree_root в событии: {event.tree_root}")
-
-            try:
-                # Сначала попробуем прямой вызов для диагностики
-                logger.debug("ПОПЫТКА ПРЯМОГО ВЫЗОВА _handle_state_change")
-                self._handle_state_change(event)
-                logger.debug("Прямой вызов выполнен")
-
-                # Затем используем call_from_thread для безопасного обновления UI
-                logger.debug("Вызов call_from_thread для _handle_state_change")
-                self.call_from_thread(self._handle_state_change_safe, event)
-                logger.debug("call_from_thread выполнен без ошибок")
-            except Exception as e:
-                logger.error(f"ОШИБКА в обработке StateChangedEvent: {e}", exc_info=True)
-
-        elif isinstance(event, ErrorOccurredEvent):
-            logger.warning(f"Получено ErrorOccurredEvent: {event.title}")
+        handlers = self._core_event_handlers.get(type(event))
+        if handlers is None:
+            logger.debug(f"Неизвестное событие от ядра: {type(event).__name__}")
+        else:
+            direct_handler, thread_handler = handlers
             try:
-                self.call_from_thread(self._handle_error, event)
+                # Событие доставляется ровно один раз: напрямую, если ядро
+                # вызвано из потока UI, иначе через call_from_thread
+                if self._is_ui_thread():
+                    direct_handler(event)
+                else:
+                    logger.debug(f"Вызов call_from_thread для {type(event).__name__}")
+                    self.call_from_thread(thread_handler, event)
             except Exception as e:
-                logger.error(f"ОШИБКА в call_from_thread для ошибки: {e}", exc_info=True)
-        else:
-            logger.debug(f"Неизвестное событие от ядра: {type(event).__name__}")
+                logger.error(f"ОШИБКА в обработке {type(event).__name__}: {e}", exc_info=True)
 
         logger.info("========== КОНЕЦ ОБРАБОТКИ СОБЫТИЯ ==========")
 
+    def _is_ui_thread(self) -> bool:
+        """Проверка, что текущий поток - поток цикла событий Textual."""
+        return self._ui_thread_id == threading.get_ident()
+
     def _handle_state_change_safe(self, event: StateChangedEvent) -> None:
         """
         Безопасная версия обработчика состояния для call_from_thread.
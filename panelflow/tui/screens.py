@@ -10,6 +10,7 @@ from textual.widgets import Static, Label
 from textual.containers import Horizontal, Vertical, Container, ScrollableContainer
 from textual.binding import Binding
 from textual.widget import Widget
+from textual.timer import Timer
 
 from panelflow.core import Application as CoreApplication
 from panelflow.core.events import (
@@ -285,6 +286,8 @@ class MainScreen(Screen):
         self.panel_widgets: List[PanelWidget] = []
         self.columns: List[Container] = []
         self.active_panel_index = 0
+        # Таймер отложенной перестройки колонок (None, если не запланирована)
+        self._columns_update_timer: Optional[Timer] = None
 
         logger.info("Инициализация MainScreen")
 
@@ -362,19 +365,27 @@ class MainScreen(Screen):
         logger.debug("Обновление заголовка")
         self._update_header(visible_path)
 
-        # Обновляем колонки с задержкой
-        def update_columns_delayed():
-            logger.debug("Запуск отложенного обновления колонок")
-            self._update_columns(visible_path)
-            logger.info("ОБНОВЛЕНИЕ ПРЕДСТАВЛЕНИЯ ЗАВЕРШЕНО")
-            logger.info("=" * 50)
+        # Сохраняем текущее состояние
+        self.visible_path = visible_path
+
+        # Серия изменений подряд (автоповтор клавиш, повторная доставка
+        # события) даёт одну перестройку колонок: отложенный вызов уже
+        # запланирован и возьмёт самый свежий путь из self.visible_path.
+        if self._columns_update_timer is not None:
+            logger.debug("Обновление колонок уже запланировано, объединяем")
+            return
 
         # Увеличиваем задержку для стабильности
-        self.set_timer(0.1, update_columns_delayed)
+        self._columns_update_timer = self.set_timer(0.1, self._flush_columns_update)
         logger.debug("Запланировано отложенное обновление колонок через 0.1с")
 
-        # Сохраняем текущее состояние
-        self.visible_path = visible_path
+    def _flush_columns_update(self) -> None:
+        """Отложенная перестройка колонок по последнему видимому пути."""
+        self._columns_update_timer = None
+        logger.debug("Запуск отложенного обновления колонок")
+        self._update_columns(self.visible_path)
+        logger.info("ОБНОВЛЕНИЕ ПРЕДСТАВЛЕНИЯ ЗАВЕРШЕНО")
+        logger.info("=" * 50)
 
     def _get_visible_path(self, tree_root: TreeNode) -> List[TreeNode]:
         """Получение пути от корня до активного узла."""
@@ -440,81 +451,80 @@ class MainScreen(Screen):
 
         logger.debug(f"Доступно {len(self.columns)} колонок, экран присоединен: {self.is_attached}")
 
-        # Очищаем текущие панели
-        logger.debug(f"Очистка {len(self.panel_widgets)} существующих панелей")
-        for i, panel_widget in enumerate(self.panel_widgets):
-            if panel_widget.parent:
-                logger.debug(f"Удаление панели {i}: '{panel_widget.node.panel_template.title}'")
-                panel_widget.remove()
-        self.panel_widgets.clear()
-
-        # Очищаем колонки
-        total_children_removed = 0
-        for i, column in enumerate(self.columns):
-            if column.is_attached:
-                children_count = len(column.children)
-                for child in list(column.children):
-                    child.remove()
-                total_children_removed += children_count
-                logger.debug(f"Колонка {i}: удалено {children_count} дочерних элементов")
-
-        logger.debug(f"Всего удалено {total_children_removed} дочерних элементов из колонок")
-
         # Определяем видимые узлы (максимум 3)
         total_nodes = len(visible_path)
         visible_nodes = visible_path[-3:] if total_nodes > 3 else visible_path
 
         logger.info(f"Видимые узлы ({len(visible_nodes)} из {total_nodes}): {[node.panel_template.title for node in visible_nodes]}")
 
-        # Создаем панели для видимых узлов
-        for i, node in enumerate(visible_nodes):
+        # Панели, уже смонтированные в колонки, по индексу колонки
+        previous_panels: Dict[int, PanelWidget] = {}
+        for panel_widget in self.panel_widgets:
+            for i, column in enumerate(self.columns):
+                if panel_widget.parent is column:
+                    previous_panels[i] = panel_widget
+                    break
+        self.panel_widgets = []
+
+        # Перестраиваем только колонки, узел которых изменился;
+        # колонки с тем же узлом лишь получают новый статус активности
+        reused_count = 0
+        for i, column in enumerate(self.columns):
+            node = visible_nodes[i] if i < len(visible_nodes) else None
+            panel_widget = previous_panels.get(i)
+
+            if node is not None and panel_widget is not None and panel_widget.node is node:
+                logger.debug(f"Колонка {i}: панель '{node.panel_template.title}' не изменилась")
+                self.panel_widgets.append(panel_widget)
+                reused_count += 1
+                if node.is_active:
+                    self.active_panel_index = i
+                    if not panel_widget.is_active:
+                        self._schedule_active_panel_setup(panel_widget)
+                elif panel_widget.is_active:
+                    panel_widget.set_active(False)
+                continue
+
+            if not column.is_attached:
+                logger.error(f"Колонка {i} недоступна для монтирования")
+                continue
+
+            if node is None and panel_widget is None and len(column.children) == 1 \
+                    and column.children[0].has_class("empty-column"):
+                logger.debug(f"Колонка {i}: пустышка уже на месте")
+                continue
+
+            children_count = len(column.children)
+            for child in list(column.children):
+                child.remove()
+            logger.debug(f"Колонка {i}: удалено {children_count} дочерних элементов")
+
+            if node is None:
+                try:
+                    column.mount(Static("Пустая колонка", classes="empty-column"))
+                    logger.debug(f"Колонка {i} заполнена пустышкой")
+                except Exception as e:
+                    logger.error(f"Ошибка заполнения пустой колонки {i}: {e}")
+                continue
+
             is_active = node.is_active
             logger.debug(f"Создание панели {i}: '{node.panel_template.title}' (active={is_active})")
 
             try:
                 panel_widget = PanelWidget(node, self.core_app, is_active)
+                column.mount(panel_widget)
+                self.panel_widgets.append(panel_widget)
+                logger.info(f"Панель '{node.panel_template.title}' добавлена в колонку {i}")
 
-                # Добавляем панель в соответствующую колонку
-                column_index = i
-                if column_index < len(self.columns) and self.columns[column_index].is_attached:
-                    self.columns[column_index].mount(panel_widget)
-                    self.panel_widgets.append(panel_widget)
-                    logger.info(f"Панель '{node.panel_template.title}' добавлена в колонку {column_index}")
-
-                    if is_active:
-                        self.active_panel_index = column_index
-                        logger.debug(f"Активная панель установлена: индекс {column_index}")
-
-                        # Принудительно устанавливаем активность и фокус
-                        def setup_active_panel():
-                            logger.debug(f"Настройка активной панели '{node.panel_template.title}'")
-                            panel_widget.set_active(True)
-                            # Устанавливаем фокус на панель
-                            if hasattr(panel_widget, 'focus'):
-                                panel_widget.focus()
-                                logger.debug(f"Фокус установлен на панель '{node.panel_template.title}'")
-
-                        # Выполняем настройку активной панели с небольшой задержкой
-                        self.set_timer(0.05, setup_active_panel)
-
-                else:
-                    logger.error(f"Колонка {column_index} недоступна для монтирования")
+                if is_active:
+                    self.active_panel_index = i
+                    logger.debug(f"Активная панель установлена: индекс {i}")
+                    self._schedule_active_panel_setup(panel_widget)
 
             except Exception as e:
                 logger.error(f"Ошибка создания панели '{node.panel_template.title}': {e}", exc_info=True)
 
-        # Заполняем пустые колонки placeholder'ами
-        empty_columns_count = 0
-        for i in range(len(visible_nodes), 3):
-            if i < len(self.columns) and self.columns[i].is_attached:
-                try:
-                    self.columns[i].mount(Static("Пустая колонка", classes="empty-column"))
-                    empty_columns_count += 1
-                    logger.debug(f"Колонка {i} заполнена пустышкой")
-                except Exception as e:
-                    logger.error(f"Ошибка заполнения пустой колонки {i}: {e}")
-
-        logger.info(f"Обновление колонок завершено: {len(self.panel_widgets)} панелей, {empty_columns_count} пустых колонок")
+        logger.info(f"Обновление колонок завершено: {len(self.panel_widgets)} панелей, из них {reused_count} без перестройки")
 
         # Принудительно обновляем экран
         try:
@@ -528,6 +538,22 @@ class MainScreen(Screen):
             children_info = [type(child).__name__ for child in column.children]
             logger.debug(f"Колонка {i} финальное состояние: {len(column.children)} детей - {children_info}")
 
+    def _schedule_active_panel_setup(self, panel_widget: PanelWidget) -> None:
+        """Отложенная активация панели и установка фокуса на неё."""
+        title = panel_widget.node.panel_template.title
+
+        # Принудительно устанавливаем активность и фокус
+        def setup_active_panel():
+            logger.debug(f"Настройка активной панели '{title}'")
+            panel_widget.set_active(True)
+            # Устанавливаем фокус на панель
+            if hasattr(panel_widget, 'focus'):
+                panel_widget.focus()
+                logger.debug(f"Фокус установлен на панель '{title}'")
+
+        # Выполняем настройку активной панели с небольшой задержкой
+        self.set_timer(0.05, setup_active_panel)
+
     # --- Обработчики действий для BINDINGS ---
 
     def action_horizontal_nav(self, direction: str) -> None:
@@ -5,10 +5,7 @@
 from typing import Optional, Any, Callable
 from textual.widget import Widget
 
-from panelflow.core.components import (
-    AbstractWidget, AbstractButton, AbstractTextInput,
-    AbstractOptionSelect, PanelLink
-)
+from panelflow.core.components import AbstractWidget
 from panelflow.core.state import TreeNode
 
 from .button import TuiButton
@@ -16,6 +13,14 @@ from .input import TuiTextInput
 from .select import TuiOptionSelect
 from .link import TuiPanelLink
 
+# Классы TUI-виджетов по дискриминатору AbstractWidget.type
+_TUI_WIDGET_CLASSES = {
+    "button": TuiButton,
+    "text_input": TuiTextInput,
+    "option_select": TuiOptionSelect,
+    "panel_link": TuiPanelLink,
+}
+
 
 def create_widget(
     abstract_widget: AbstractWidget,
@@ -34,20 +39,11 @@ def create_widget(
     Returns:
         Конкретный виджет Textual или None если тип неизвестен
     """
-    if isinstance(abstract_widget, AbstractButton):
-        return TuiButton(abstract_widget, node, post_event_callback)
-
-    elif isinstance(abstract_widget, AbstractTextInput):
-        return TuiTextInput(abstract_widget, node, post_event_callback)
-
-    elif isinstance(abstract_widget, AbstractOptionSelect):
-        return TuiOptionSelect(abstract_widget, node, post_event_callback)
-
-    elif isinstance(abstract_widget, PanelLink):
-        return TuiPanelLink(abstract_widget, node, post_event_callback)
-
-    # Неизвестный тип виджета
-    return None
+    widget_class = _TUI_WIDGET_CLASSES.get(abstract_widget.type)
+    if widget_class is None:
+        # Неизвестный тип виджета
+        return None
+    return widget_class(abstract_widget, node, post_event_callback)
 
 
 __all__ = [
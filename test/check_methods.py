@@ -22,6 +22,7 @@ def check_application_methods():
         'post_event',
         'subscribe_to_events',
         'unsubscribe_from_events',
+        'batch_events',
 
         # Приватные методы обработки событий
         '_handle_widget_submission',
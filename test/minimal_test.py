@@ -3,9 +3,6 @@
 Минимальный тест для пошаговой диагностики навигации.
 """
 
-import tempfile
-import json
-from pathlib import Path
 from typing import Any
 
 from panelflow.core import Application
@@ -74,20 +71,12 @@ def test_step_by_step():
     config = create_minimal_config()
     handler_map = {"MinimalHandler": MinimalHandler}
 
-    temp_file = tempfile.NamedTemporaryFile(
-        mode='w', suffix='.json', delete=False, encoding='utf-8'
-    )
-    json.dump(config, temp_file, ensure_ascii=False, indent=2)
-    temp_file.close()
-
     try:
-        app = Application(temp_file.name, handler_map)
+        app = Application.from_mapping(config, handler_map)
         print("✅ Приложение создано успешно")
     except Exception as e:
         print(f"❌ Ошибка создания приложения: {e}")
         return
-    finally:
-        Path(temp_file.name).unlink()
 
     # Шаг 2: Проверка начального состояния
     print(f"\n🏠 Шаг 2: Проверка начального состояния")
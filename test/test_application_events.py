@@ -0,0 +1,174 @@
+"""
+Тесты обработки событий ядром PanelFlow.
+Проверяют индекс виджетов и доставку событий подписчикам.
+"""
+
+import gc
+
+import pytest
+
+import test_navigation
+from panelflow.core import Application
+from panelflow.core.handlers import BasePanelHandler
+from panelflow.core.events import (
+    WidgetSubmittedEvent, BackNavigationEvent,
+    StateChangedEvent, ErrorOccurredEvent
+)
+
+
+class SwitchingTargetHandler(BasePanelHandler):
+    """Обработчик навигации к панели из атрибута класса target."""
+
+    target = "child_panel"
+
+    def on_widget_update(self, widget_id, value):
+        return ("navigate_down", self.target)
+
+
+class TestApplicationEvents:
+    """Тесты обработки событий Application."""
+
+    def setup_method(self):
+        """Подготовка к тестам."""
+        self.handler_map = {
+            "TestNavigationHandler": test_navigation.TestNavigationHandler,
+            "TestFormHandler": test_navigation.TestFormHandler
+        }
+        self.events_received = []
+        self.app = Application.from_mapping(test_navigation.create_test_config(), self.handler_map)
+        self.app.subscribe_to_events(self.events_received.append)
+
+    def test_context_is_read_only(self):
+        """Тест единого контракта контекста для корневого и дочерних узлов."""
+        app = self.app
+        app.post_event(WidgetSubmittedEvent(widget_id="text_input", value="data"))
+        app.post_event(WidgetSubmittedEvent(widget_id="nav_button", value=True))
+
+        for node in (app.tree_root, app.active_node):
+            with pytest.raises(TypeError):
+                node.context["key"] = "value"
+        assert dict(app.tree_root.context) == {}
+        assert app.active_node.context["text_input"] == "data"
+
+    def test_widget_index(self):
+        """Тест индекса виджетов при навигации."""
+        app = self.app
+
+        # Виджеты корневой панели доступны сразу после инициализации
+        assert app._find_node_by_widget_id("nav_button") is app.tree_root
+        assert app._find_node_by_widget_id("child_text") is None
+
+        # После навигации вниз индексируются виджеты дочерней панели
+        app.post_event(WidgetSubmittedEvent(widget_id="nav_button", value=True))
+        child = app.active_node
+        assert app._find_node_by_widget_id("child_text") is child
+
+        # После закрытия панели ее виджеты удаляются из индекса
+        app.post_event(BackNavigationEvent())
+        assert "child_text" not in app._widget_index
+        assert app._find_node_by_widget_id("child_text") is None
+
+    def test_weak_subscribers(self):
+        """Тест подписки через связанный метод без удержания владельца."""
+        app = self.app
+
+        class Listener:
+            def __init__(self):
+                self.events = []
+
+            def on_event(self, event):
+                self.events.append(event)
+
+        listener = Listener()
+        app.subscribe_to_events(listener.on_event)
+        app.subscribe_to_events(listener.on_event)
+        assert len(app._event_subscribers) == 2  # events_received.append + listener
+
+        app.post_event(WidgetSubmittedEvent(widget_id="text_input", value="data"))
+        assert len(listener.events) == 1
+
+        # Удаление владельца снимает подписку
+        del listener
+        gc.collect()
+        assert len(app._event_subscribers) == 1
+
+        # Обычные функции удерживаются подпиской
+        received = []
+        app.subscribe_to_events(lambda event: received.append(event))
+        gc.collect()
+        app.post_event(WidgetSubmittedEvent(widget_id="text_input", value="data"))
+        assert len(received) == 1
+
+    def test_typed_subscribers(self):
+        """Тест подписки на отдельный тип события."""
+        app = self.app
+
+        errors = []
+        callback = errors.append
+        app.subscribe_to_events(callback, ErrorOccurredEvent)
+
+        # StateChangedEvent не доставляется подписчику на ошибки
+        app.post_event(WidgetSubmittedEvent(widget_id="nav_button", value="go"))
+        assert errors == []
+
+        app.post_event(BackNavigationEvent())
+        app.post_event(WidgetSubmittedEvent(widget_id="error_button", value=True))
+        assert len(errors) == 1
+        assert isinstance(errors[0], ErrorOccurredEvent)
+
+        app.unsubscribe_from_events(callback, ErrorOccurredEvent)
+        assert ErrorOccurredEvent not in app._typed_subscribers
+
+    def test_batch_events(self):
+        """Тест объединения StateChangedEvent в batch_events."""
+        app = self.app
+
+        with app.batch_events():
+            app.post_event(WidgetSubmittedEvent(widget_id="text_input", value="data"))
+            with app.batch_events():
+                app.post_event(WidgetSubmittedEvent(widget_id="nav_button", value=True))
+            assert self.events_received == []
+
+        state_events = [e for e in self.events_received if isinstance(e, StateChangedEvent)]
+        assert len(state_events) == 1
+        assert app.active_node.panel_template.id == "child_panel"
+
+        # Без изменений состояния событие не публикуется
+        self.events_received.clear()
+        with app.batch_events():
+            pass
+        assert self.events_received == []
+
+        # Ошибки внутри блока публикуются сразу
+        with app.batch_events():
+            app.post_event(BackNavigationEvent())
+            app.post_event(WidgetSubmittedEvent(widget_id="error_button", value=True))
+            assert [type(e) for e in self.events_received] == [ErrorOccurredEvent]
+        assert isinstance(self.events_received[-1], StateChangedEvent)
+
+    def test_failed_navigation_keeps_active_path(self):
+        """Тест сохранения дерева и пути до активного узла при ошибке навигации."""
+        config = {
+            "entryPanel": "main",
+            "panels": [
+                {"id": "main", "title": "Main", "handler_class_name": "Switching",
+                 "widgets": [{"id": "go", "type": "button", "title": "Go"}]},
+                {"id": "child_panel", "title": "Child"}
+            ]
+        }
+        handler = type("Switching", (SwitchingTargetHandler,), {})
+        app = Application.from_mapping(config, {"Switching": handler})
+
+        app.post_event(WidgetSubmittedEvent(widget_id="go", value=True))
+        child = app.active_node
+        path = app._get_path_to_active_node()
+        assert path == (app.tree_root, child)
+
+        # Повторная навигация с того же виджета к несуществующей панели
+        handler.target = "missing"
+        app.post_event(WidgetSubmittedEvent(widget_id="go", value=True))
+
+        assert app.active_node is child
+        assert child.parent is app.tree_root
+        assert app.tree_root.children_stacks["go"] == [child]
+        assert app._get_path_to_active_node() == (app.tree_root, child)
@@ -5,6 +5,7 @@
 
 import pytest
 import json
+import sys
 import tempfile
 from pathlib import Path
 from jsonschema import ValidationError
@@ -171,6 +172,28 @@ class TestConfigLoader:
         finally:
             config_path.unlink()
 
+    def test_schema_validation_widget_type_fields(self):
+        """Тест сообщений валидации полей, зависящих от типа виджета."""
+        cases = [
+            ({"id": "link", "type": "panel_link", "title": "Link"}, "'target_panel_id' is a required property"),
+            ({"id": "select", "type": "option_select", "title": "Select", "options": [1]}, "1 is not of type 'string'"),
+            ({"id": "invalid", "type": "unknown_type", "title": "Invalid"}, "'unknown_type' is not one of"),
+        ]
+
+        for widget, message in cases:
+            config = {"entryPanel": "main", "panels": [{"id": "main", "title": "Main", "widgets": [widget]}]}
+            with pytest.raises(ValidationError, match=message):
+                Application.from_mapping(config, self.handler_map)
+
+    def test_compiled_validator_up_to_date(self):
+        """Тест соответствия сгенерированного модуля проверки текущей схеме."""
+        pytest.importorskip("fastjsonschema")
+        from panelflow.core import _config_validator
+        from panelflow.core.application import _schema_fingerprint
+
+        # При расхождении: python utils/generate_config_validator.py
+        assert _config_validator.SCHEMA_FINGERPRINT == _schema_fingerprint()
+
     def test_integrity_nonexistent_entry_panel(self):
         """Тест проверки целостности - несуществующая entryPanel."""
         invalid_config = {
@@ -244,6 +267,106 @@ class TestConfigLoader:
         finally:
             config_path.unlink()
 
+    def test_panel_templates_frozen_after_load(self):
+        """Тест неизменяемости шаблонов панелей после загрузки."""
+        config_path = self.create_temp_config(self.valid_config)
+        try:
+            app = Application(config_path, self.handler_map)
+
+            main_panel = app._panel_templates["main"]
+            assert isinstance(main_panel.widgets, tuple)
+
+            # Идентификаторы интернированы
+            assert main_panel.id is sys.intern("main")
+            assert main_panel.widgets[0].id is sys.intern("text_input")
+
+        finally:
+            config_path.unlink()
+
+    def test_config_reloaded_after_change(self):
+        """Тест повторной загрузки измененного файла конфигурации."""
+        config_path = self.create_temp_config(self.valid_config)
+        try:
+            first = Application(config_path, self.handler_map)
+            second = Application(config_path, self.handler_map)
+            assert second._panel_templates["main"].title == "Main Panel"
+            assert first._panel_templates["main"] is not second._panel_templates["main"]
+
+            changed_config = json.loads(json.dumps(self.valid_config))
+            changed_config["panels"][0]["title"] = "Changed Main Panel"
+            config_path.write_text(json.dumps(changed_config), encoding='utf-8')
+
+            app = Application(config_path, self.handler_map)
+            assert app._panel_templates["main"].title == "Changed Main Panel"
+
+        finally:
+            config_path.unlink()
+
+    def test_templates_do_not_share_config_data(self):
+        """Тест независимости шаблонов от общих данных конфигурации."""
+        config = json.loads(json.dumps(self.valid_config))
+        config["panels"][0]["widgets"].append({
+            "id": "select", "type": "option_select", "title": "Select",
+            "options": ["a", "b"], "value": ["a"]
+        })
+        config_path = self.create_temp_config(config)
+        try:
+            first = Application(config_path, self.handler_map)
+            second = Application(config_path, self.handler_map)
+            first_select = first._panel_templates["main"].widgets[2]
+            second_select = second._panel_templates["main"].widgets[2]
+            assert first_select.options == ["a", "b"]
+
+            # Изменение опций и значения в одном экземпляре не затрагивает другой и кэш
+            first_select.options.append("c")
+            first_select.value.append("b")
+            assert second_select.options == ["a", "b"]
+            assert second_select.value == ["a"]
+            assert Application(config_path, self.handler_map)._panel_templates["main"].widgets[2].value == ["a"]
+
+        finally:
+            config_path.unlink()
+
+        # from_validated не передает в шаблоны изменяемые данные вызывающего
+        app = Application.from_validated(config, self.handler_map)
+        config["panels"][0]["widgets"][2]["options"].append("c")
+        assert app._panel_templates["main"].widgets[2].options == ["a", "b"]
+
+    def test_from_mapping(self):
+        """Тест создания приложения из словаря конфигурации без файла."""
+        app = Application.from_mapping(self.valid_config, self.handler_map)
+
+        assert app.config_path is None
+        assert app.active_node.panel_template.id == "main"
+        assert set(app._panel_templates) == {"main"}
+
+        invalid_config = {"entryPanel": "nonexistent", "panels": [{"id": "main", "title": "Main"}]}
+        with pytest.raises(ValueError, match="Панель входа 'nonexistent' не найдена"):
+            Application.from_mapping(invalid_config, self.handler_map)
+
+    def test_validation_can_be_skipped(self):
+        """Тест отключения проверок для заранее проверенной конфигурации."""
+        config_path = self.create_temp_config(self.valid_config)
+        try:
+            config_data = Application.validate_config_file(config_path)
+            app = Application.from_validated(config_data, self.handler_map)
+            assert app.active_node.panel_template.id == "main"
+
+            # Изменение возвращенных данных не затрагивает кэш конфигураций
+            config_data["panels"].clear()
+            assert Application.validate_config_file(config_path)["panels"]
+            app = Application(config_path, self.handler_map)
+            assert app.active_node.panel_template.id == "main"
+        finally:
+            config_path.unlink()
+
+        # Неизвестный обработчик не проверяется при validate_integrity=False
+        app = Application.from_mapping(self.valid_config, {}, validate_integrity=False)
+        assert app.active_node.panel_template.id == "main"
+
+        with pytest.raises(ValueError):
+            Application.from_validated(self.valid_config, {})
+
     def test_widget_creation_all_types(self):
         """Тест создания всех типов виджетов."""
         config_with_all_widgets = {
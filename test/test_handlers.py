@@ -0,0 +1,53 @@
+"""
+Тесты базового обработчика панелей PanelFlow.
+Проверяют привязку методов к виджетам декоратором on_widget.
+"""
+
+from panelflow.core.handlers import BasePanelHandler, on_widget
+
+
+class DecoratedHandler(BasePanelHandler):
+    """Обработчик с методами, привязанными к виджетам."""
+
+    @on_widget("nav_button")
+    def navigate(self, widget_id, value):
+        return ("navigate_down", "child_panel")
+
+    @on_widget("text_input", "child_text")
+    def store(self, widget_id, value):
+        self.form_data[widget_id] = value
+
+
+class ChildHandler(DecoratedHandler):
+    """Подкласс, переопределяющий привязку кнопки навигации."""
+
+    @on_widget("nav_button")
+    def navigate(self, widget_id, value):
+        return ("navigate_down", "result_panel")
+
+
+class OverridingHandler(DecoratedHandler):
+    """Подкласс, переопределяющий метод без повторного декоратора."""
+
+    def store(self, widget_id, value):
+        self.form_data[widget_id] = value.upper()
+
+
+def test_widget_dispatch_handler():
+    """Тест обработчика с методами, привязанными к виджетам."""
+    handler = DecoratedHandler(context={}, form_data={})
+    assert handler.on_widget_update("nav_button", True) == ("navigate_down", "child_panel")
+    assert handler.on_widget_update("child_text", "x") is None
+    assert handler.form_data == {"child_text": "x"}
+    assert handler.on_widget_update("unknown", None) is None
+
+    # Подклассы наследуют и переопределяют привязки
+    child = ChildHandler(context={}, form_data={})
+    assert child.on_widget_update("nav_button", True) == ("navigate_down", "result_panel")
+    assert child.on_widget_update("text_input", "y") is None
+    assert child.form_data == {"text_input": "y"}
+
+    # Переопределенный метод вызывается и без повторного @on_widget
+    overriding = OverridingHandler(context={}, form_data={})
+    assert overriding.on_widget_update("text_input", "z") is None
+    assert overriding.form_data == {"text_input": "Z"}
@@ -198,6 +198,15 @@ class NavigationTestSuite:
         assert "text_input" in app.active_node.context
         assert app.active_node.context["text_input"] == "test data"
 
+        # Контекст - представление формы родителя только для чтения
+        app.active_node.parent.form_data["text_input"] = "changed"
+        assert app.active_node.context["text_input"] == "changed"
+        try:
+            app.active_node.context["text_input"] = "x"
+            assert False, "Контекст должен быть только для чтения"
+        except TypeError:
+            pass
+
         print("✅ Передача данных работает корректно")
         return app
 
@@ -339,6 +348,54 @@ class NavigationTestSuite:
             traceback.print_exc()
 
 
+class DirectoryHandler(BasePanelHandler):
+    """Обработчик панели, открывающей саму себя (папка в папке)."""
+
+    def on_widget_update(self, widget_id: str, value: Any) -> tuple | None:
+        if widget_id == "open":
+            return ("navigate_down", "dir")
+        return None
+
+
+def test_duplicate_widget_ids_resolve_to_first_node_in_tree_order():
+    """Тест выбора узла для ID виджета, который есть у нескольких живых узлов."""
+    config = {
+        "entryPanel": "dir",
+        "panels": [
+            {
+                "id": "dir",
+                "title": "Папка",
+                "handler_class_name": "DirectoryHandler",
+                "widgets": [
+                    {"id": "name", "type": "text_input", "title": "Имя"},
+                    {"id": "open", "type": "button", "title": "Открыть"}
+                ]
+            }
+        ]
+    }
+    app = Application.from_mapping(config, {"DirectoryHandler": DirectoryHandler})
+    root = app.tree_root
+
+    app.post_event(WidgetSubmittedEvent(widget_id="open", value=True))
+    child = app.active_node
+    assert child.parent is root
+
+    # Событие получает первый узел в прямом порядке обхода - корень,
+    # даже если активна дочерняя панель
+    app.post_event(WidgetSubmittedEvent(widget_id="name", value="root value"))
+    assert root.form_data["name"] == "root value"
+    assert "name" not in child.form_data
+    assert app._find_node_by_widget_id("name") is root
+
+    # После закрытия дочерней панели владельцем остается только корень
+    app.post_event(BackNavigationEvent())
+    assert [entry[0] for entry in app._widget_index["name"]] == [root]
+
+    # ID без живых владельцев отсекается индексом, без обхода дерева
+    assert "missing" not in app._widget_index
+    assert app._lookup_widget("missing") is None
+
+
 if __name__ == "__main__":
     suite = NavigationTestSuite()
     suite.run_all_tests()
\ No newline at end of file
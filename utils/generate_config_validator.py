@@ -0,0 +1,53 @@
+# generate_config_validator.py
+"""
+Генерация модуля panelflow/core/_config_validator.py.
+
+Компилирует APPLICATION_CONFIG_SCHEMA через fastjsonschema.compile_to_code
+и записывает результат в модуль с обычной функцией validate(data), чтобы
+схема не компилировалась при каждом запуске приложения.
+
+Запуск из корня репозитория после любого изменения схемы:
+    python utils/generate_config_validator.py
+"""
+
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from panelflow.core.application import (  # noqa: E402
+    APPLICATION_CONFIG_SCHEMA, _schema_fingerprint
+)
+
+OUTPUT_PATH = ROOT / "panelflow" / "core" / "_config_validator.py"
+
+HEADER = '''"""
+Скомпилированная проверка APPLICATION_CONFIG_SCHEMA.
+Сгенерировано utils/generate_config_validator.py - не редактировать вручную.
+"""
+
+SCHEMA_FINGERPRINT = "{fingerprint}"
+
+'''
+
+
+def generate() -> Path:
+    """
+    Генерация модуля проверки конфигурации.
+
+    Returns:
+        Путь к записанному модулю
+    """
+    # use_default=False: проверка не должна дописывать значения
+    # по умолчанию в данные конфигурации
+    code = fastjsonschema.compile_to_code(APPLICATION_CONFIG_SCHEMA, use_default=False)
+    header = HEADER.format(fingerprint=_schema_fingerprint())
+    OUTPUT_PATH.write_text(header + code.rstrip() + "\n", encoding="utf-8")
+    return OUTPUT_PATH
+
+
+if __name__ == "__main__":
+    print(f"Записан {generate()}")